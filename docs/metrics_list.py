@@ -2,29 +2,53 @@
 A list of presented metrics as strings
 """
 
-from python_ext_stats.metrics.average_based_metrics import AverageBasedMetrics
-from python_ext_stats.metrics.cbo_metric import CBOMetric
-from python_ext_stats.metrics.class_metrics import ClassMetrics
-from python_ext_stats.metrics.code_complexity_and_quality_metrics\
-    import CodeComplexityAndQualityMetrics
-from python_ext_stats.metrics.code_structure_metrics import CodeStructuresMetrics
-from python_ext_stats.metrics.dependency_and_coupling_metrics\
-    import DependencyAndCouplingMetrics
-from python_ext_stats.metrics.maintainability_metrics import MaintainabilityMetrics
-from python_ext_stats.metrics.project_file_structure_metrics import ProjectFileStructureMetrics
-from python_ext_stats.metrics.readability_and_formatting_metrics \
-    import ReadabilityAndFormattingMetrics
+import functools
+from typing import Any, Tuple
 
 
+@functools.lru_cache(maxsize=None)
+def get_metrics_list() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Collects available metrics of every metrics group.
+    Metric modules are imported on the first call, so importing this module stays cheap.
+    The result is built once and is immutable, so it is shared by all callers.
 
-metrics_list = [
-    AverageBasedMetrics.available_metrics(),
-    CBOMetric.available_metrics(),
-    ClassMetrics.available_metrics(),
-    CodeComplexityAndQualityMetrics.available_metrics(),
-    CodeStructuresMetrics.available_metrics(),
-    DependencyAndCouplingMetrics.available_metrics(),
-    MaintainabilityMetrics.available_metrics(),
-    ProjectFileStructureMetrics.available_metrics(),
-    ReadabilityAndFormattingMetrics.available_metrics()
-]
+    Returns:
+        Tuple[Tuple[str, ...], ...]: available metrics' names grouped by metrics class
+    """
+    # pylint: disable=import-outside-toplevel
+    from python_ext_stats.metrics.average_based_metrics import AverageBasedMetrics
+    from python_ext_stats.metrics.cbo_metric import CBOMetric
+    from python_ext_stats.metrics.class_metrics import ClassMetrics
+    from python_ext_stats.metrics.code_complexity_and_quality_metrics\
+        import CodeComplexityAndQualityMetrics
+    from python_ext_stats.metrics.code_structure_metrics import CodeStructuresMetrics
+    from python_ext_stats.metrics.dependency_and_coupling_metrics\
+        import DependencyAndCouplingMetrics
+    from python_ext_stats.metrics.maintainability_metrics import MaintainabilityMetrics
+    from python_ext_stats.metrics.project_file_structure_metrics\
+        import ProjectFileStructureMetrics
+    from python_ext_stats.metrics.readability_and_formatting_metrics \
+        import ReadabilityAndFormattingMetrics
+
+    metrics_classes = (
+        AverageBasedMetrics,
+        CBOMetric,
+        ClassMetrics,
+        CodeComplexityAndQualityMetrics,
+        CodeStructuresMetrics,
+        DependencyAndCouplingMetrics,
+        MaintainabilityMetrics,
+        ProjectFileStructureMetrics,
+        ReadabilityAndFormattingMetrics
+    )
+    return tuple(tuple(metrics.available_metrics()) for metrics in metrics_classes)
+
+def __getattr__(name: str) -> Any:
+    """
+    Keeps `metrics_list` importable as a module attribute, built on first access.
+    Like before it is a list of lists.
+    """
+    if name == "metrics_list":
+        return [list(group) for group in get_metrics_list()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,8 @@
+"""
+This module allows to run the python-ext-stats as `python -m python_ext_stats`
+"""
+from python_ext_stats.main import main
+
+
+if __name__ == "__main__":
+    main()
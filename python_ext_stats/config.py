@@ -2,4 +2,19 @@
 This module includes certain config settings
 """
 
-VENV_DIRS = {'venv', '.venv', 'env', 'virtualenv'}
+VENV_DIRS = frozenset({'venv', '.venv', 'env', 'virtualenv'})
+
+# Minimal number of modules for which per-module work is spread across processes
+PARALLEL_MIN_ITEMS = 64
+
+# Maximal number of threads used to read files concurrently
+IO_MAX_WORKERS = 32
+
+# Environment variable pointing to a directory for persistent per-file results
+DISK_CACHE_ENV = 'PYTHON_EXT_STATS_CACHE_DIR'
+
+# Bumped whenever stored results change their meaning
+DISK_CACHE_VERSION = 1
+
+# Maximal number of results kept in the persistent cache
+DISK_CACHE_MAX_ENTRIES = 100_000
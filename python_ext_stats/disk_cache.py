@@ -0,0 +1,139 @@
+"""
+This module provides a persistent cache of per-file metric results keyed by file content
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from python_ext_stats import config
+from python_ext_stats.parser_cache import cache_key
+
+
+# Created next to the entries whenever one is written, so pruning can skip unchanged caches
+_PRUNE_MARKER = "prune-pending"
+
+
+def cache_dir() -> Optional[Path]:
+    """
+    Gets the directory of the on-disk cache from the PYTHON_EXT_STATS_CACHE_DIR variable.
+
+    Returns:
+        Optional[Path]: cache directory, or None if caching is disabled
+    """
+    directory = os.environ.get(config.DISK_CACHE_ENV)
+    return Path(directory) if directory else None
+
+
+def cached(kind: str, path: Union[str, Path], compute: Callable[[], Any]) -> Any:
+    """
+    Returns a stored result for the content of a file, computing and storing it on a miss.
+    Without a cache directory the result is simply computed.
+
+    Args:
+        kind (str): Name of the metric, results of different kinds are kept apart.
+        path (Union[str, Path]): File the result is computed for.
+        compute (Callable[[], Any]): Computes a JSON serializable result.
+
+    Returns:
+        Any: result for the file
+    """
+    directory = cache_dir()
+    if directory is None:
+        return compute()
+
+    key = content_key(*cache_key(path))
+    entry = directory / _kind_dir(kind) / key[:2] / key[2:]
+
+    try:
+        return json.loads(entry.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    result = compute()
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved in, so parallel workers never read a partial entry
+        tmp_entry = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        tmp_entry.write_bytes(json.dumps(result).encode())
+        os.replace(tmp_entry, entry)
+        (directory / _PRUNE_MARKER).touch()
+    except OSError:
+        pass
+
+    return result
+
+
+@functools.lru_cache(maxsize=4096)
+def content_key(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Hashes the content of a file, memoized by path and file stats,
+    so results of several metrics for one file hash it once per run.
+
+    Args:
+        path (str): Path to the file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        str: hex digest of the content
+    """
+    # mtime_ns and size are only a part of the cache key
+    del mtime_ns, size
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+def _kind_dir(kind: str) -> str:
+    """
+    Names the directory of one metric kind. Results depend on the AST of the
+    running python, so each minor version keeps its own entries.
+
+    Returns:
+        str: directory name
+    """
+    return f"{kind}-v{config.DISK_CACHE_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def prune(max_entries: int = config.DISK_CACHE_MAX_ENTRIES) -> None:
+    """
+    Deletes the least recently written entries once the cache holds more than max_entries.
+    The cache is only scanned if entries were written since the last pruning,
+    so a warm cache costs a single failed unlink.
+
+    Args:
+        max_entries (int): Number of entries to keep.
+    """
+    directory = cache_dir()
+    if directory is None:
+        return
+
+    try:
+        # Removed before the scan, so entries written meanwhile mark the cache again
+        (directory / _PRUNE_MARKER).unlink()
+    except OSError:
+        return
+
+    entries = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name == _PRUNE_MARKER:
+                continue
+            entry = os.path.join(root, name)
+            try:
+                entries.append((os.stat(entry).st_mtime_ns, entry))
+            except OSError:
+                continue
+
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort()
+    for _, entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry)
+        except OSError:
+            continue
@@ -1,17 +1,15 @@
 """
 Module for analyzing Python repositories and generating metrics reports.
 """
-import ast
-import sys
-from datetime import datetime
+import os
 import time
 from pathlib import Path
-from typing import Dict, List
-import xml.dom.minidom
-import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import XMLGenerator
 
-from docs.metrics_list import metrics_list as ml
+from docs.metrics_list import get_metrics_list
 
+from python_ext_stats import disk_cache
 from python_ext_stats.config import VENV_DIRS
 from python_ext_stats.metrics.average_based_metrics import AverageBasedMetrics
 from python_ext_stats.metrics.cbo_metric import CBOMetric
@@ -31,6 +29,7 @@ from python_ext_stats.metrics.project_metrics import ProjectMetrics
 from python_ext_stats.metrics.readability_and_formatting_metrics import (
     ReadabilityAndFormattingMetrics,
 )
+from python_ext_stats.parser_cache import parse_files
 
 
 class ExtPythonStats:
@@ -40,49 +39,33 @@ class ExtPythonStats:
     Provides metrics described in docs/metrics.tex according to the repos.
     """
 
-    __metrics: List[str] = ml.copy()
-
     def __init__(self, repo_path: str):
         """
         Initiates an example of ExtPythonStats.
 
         Args:
             repo_path (str): Path to the repository to analyse.
+
+        Raises:
+            SyntaxError: If a python file of the repository cannot be parsed.
         """
         self.path = repo_path
         self.repo_path = Path(self.path)
 
-        self.all_files = [
-            f for f in self.repo_path.rglob("*")
-            if f.is_file() and not any(part in VENV_DIRS for part in f.parts)
-        ]
-
-        self.py_files = [
-            f for f in self.repo_path.rglob("*.py")
-            if not any(part in VENV_DIRS for part in f.parts)
-        ]
-
-        self.parsed_py_files = []
+        self.all_files, self.py_files = _scan_repo(self.repo_path)
 
-        for py_file_path in self.py_files:
-            with open(py_file_path, "r", encoding="utf-8") as file:
-                code = file.read()
-
-            try:
-                self.parsed_py_files.append(ast.parse(code))
-            except SyntaxError:
-                print(f"Unable to parse presented py file: {py_file_path}")
-                sys.exit()
+        self.parsed_py_files = parse_files(self.py_files)
 
     @classmethod
-    def metrics_list(cls) -> List[str]:
+    def metrics_list(cls) -> List[List[str]]:
         """
         Provides a list of available metrics.
 
         Returns:
-            List[str]: A list of metrics that can be calculated.
+            List[List[str]]: Metrics that can be calculated, grouped by metrics class.
         """
-        return cls.__metrics
+        # Lists are copied from the shared names, so callers may change them freely
+        return [list(group) for group in get_metrics_list()]
 
     def get_metric_by_name(self, metric_name: str) -> ProjectMetrics:
         """
@@ -108,27 +91,30 @@ class ExtPythonStats:
         Returns:
             None.
         """
-        root = ET.Element("report")
         worktime = report_data["worktime"]
         del report_data["worktime"]
 
-        ET.SubElement(root, "worktime").text = str(round(worktime, 1)) + " secs"
-        ET.SubElement(root, "report-time").text = datetime.now().strftime("%d.%m.%Y")
-        ET.SubElement(root, "repository-path").text = str(self.repo_path)
-
-        metrics_element = ET.SubElement(root, "metrics")
+        with open(filename, "wb") as report_file:
+            xml = XMLGenerator(report_file, encoding="utf-8", short_empty_elements=True)
+            xml.startDocument()
+            xml.startElement("report", {})
 
-        for metric_name, metric_value in report_data.items():
-            metric_elem = ET.SubElement(metrics_element, "metric")
-            metric_elem.set("name", str(metric_name))
-            metric_elem.text = str(metric_value)
+            _write_text_element(xml, "worktime", str(round(worktime, 1)) + " secs", 1)
+            _write_text_element(xml, "report-time", time.strftime("%d.%m.%Y"), 1)
+            _write_text_element(xml, "repository-path", str(self.repo_path), 1)
 
-        xml_str = ET.tostring(root, encoding="utf-8", xml_declaration=True)
-        dom = xml.dom.minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent=" ")
+            xml.ignorableWhitespace("\n ")
+            xml.startElement("metrics", {})
+            for metric_name, metric_value in report_data.items():
+                _write_text_element(xml, "metric", str(metric_value), 2,
+                                    {"name": str(metric_name)})
+            xml.ignorableWhitespace("\n ")
+            xml.endElement("metrics")
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(pretty_xml)
+            xml.ignorableWhitespace("\n")
+            xml.endElement("report")
+            xml.endDocument()
+            report_file.write(b"\n")
 
     def report(self) -> Dict:
         """
@@ -140,51 +126,83 @@ class ExtPythonStats:
         result_metrics_dict = {}
         result_metrics_dict["worktime"] = time.time()
 
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **CodeStructuresMetrics().value(parsed_py_files=self.parsed_py_files),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **DependencyAndCouplingMetrics().value(
-                parsed_py_files=self.parsed_py_files, all_files=self.all_files
-            ),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **CBOMetric().value(parsed_py_files=self.parsed_py_files),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **ProjectFileStructureMetrics().value(\
-                all_files=self.all_files, repo_path=self.repo_path),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **AverageBasedMetrics().value(\
-                parsed_py_files=self.parsed_py_files, py_files=self.py_files),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **MaintainabilityMetrics().value(parsed_py_files=self.parsed_py_files),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **ClassMetrics().value(parsed_py_files=self.parsed_py_files),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **ReadabilityAndFormattingMetrics().value(
-                parsed_py_files=self.parsed_py_files, py_files=self.py_files
-            ),
-        }
-        result_metrics_dict = {
-            **result_metrics_dict,
-            **CodeComplexityAndQualityMetrics().value(
-                parsed_py_files=self.parsed_py_files, py_files=self.py_files
-            ),
-        }
+        result_metrics_dict.update(
+            CodeStructuresMetrics().value(parsed_py_files=self.parsed_py_files))
+        result_metrics_dict.update(DependencyAndCouplingMetrics().value(
+            parsed_py_files=self.parsed_py_files, all_files=self.all_files))
+        result_metrics_dict.update(CBOMetric().value(parsed_py_files=self.parsed_py_files))
+        result_metrics_dict.update(ProjectFileStructureMetrics().value(
+            all_files=self.all_files, repo_path=self.repo_path))
+        result_metrics_dict.update(AverageBasedMetrics().value(
+            parsed_py_files=self.parsed_py_files, py_files=self.py_files))
+        result_metrics_dict.update(
+            MaintainabilityMetrics().value(parsed_py_files=self.parsed_py_files))
+        result_metrics_dict.update(ClassMetrics().value(parsed_py_files=self.parsed_py_files))
+        result_metrics_dict.update(ReadabilityAndFormattingMetrics().value(
+            parsed_py_files=self.parsed_py_files, py_files=self.py_files))
+        result_metrics_dict.update(CodeComplexityAndQualityMetrics().value(
+            parsed_py_files=self.parsed_py_files, py_files=self.py_files))
+
+        # Stored results of all metric groups are trimmed once the whole run has finished
+        disk_cache.prune()
 
         result_metrics_dict["worktime"] = time.time() - result_metrics_dict["worktime"]
 
         return result_metrics_dict
+
+
+def _scan_repo(repo_path: Path) -> Tuple[List[Path], List[Path]]:
+    """
+    Collects all files and python files of a repository in a single walk.
+    Virtual environment directories are pruned before they are entered.
+
+    Args:
+        repo_path (Path): Path to the repository.
+
+    Returns:
+        Tuple[List[Path], List[Path]]: all files and python files
+    """
+    all_files = []
+    py_files = []
+    # Directories are visited in the same preorder as os.walk, while the entries'
+    # cached file types save a stat call for every file
+    pending = [os.fspath(repo_path)]
+
+    while pending:
+        sub_dirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name in VENV_DIRS:
+                        continue
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    elif entry.is_file():
+                        file_path = Path(entry.path)
+                        all_files.append(file_path)
+                        if entry.name.endswith(".py"):
+                            py_files.append(file_path)
+        except OSError:
+            continue
+        pending.extend(reversed(sub_dirs))
+
+    return all_files, py_files
+
+
+def _write_text_element(xml: XMLGenerator, name: str, text: str, depth: int,
+                        attributes: Optional[Dict[str, str]] = None) -> None:
+    """
+    Streams an element holding only text on its own line, indented by depth.
+
+    Args:
+        xml (XMLGenerator): Generator writing the report.
+        name (str): Element name.
+        text (str): Element text.
+        depth (int): Nesting level of the element.
+        attributes (Optional[Dict[str, str]]): Element attributes.
+    """
+    xml.ignorableWhitespace("\n" + " " * depth)
+    xml.startElement(name, attributes or {})
+    xml.characters(text)
+    xml.endElement(name)
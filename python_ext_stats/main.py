@@ -5,17 +5,17 @@ import warnings
 import sys
 import click
 
-from python_ext_stats.ext_python_stats import ExtPythonStats
-
 
 sys.setrecursionlimit(5000)
 
 
 @click.command()
-@click.option('--path', '-p', required=True, help='Path to the repository.')
+@click.option('--path', '-p', required=True, help='Path to the repository.',
+              type=click.Path(exists=True, file_okay=False))
 @click.option('--report', '-r', required=True, help='Name of the report file.',
                default="result_python_extended_stats.xml")
-def main(path="", report=""):
+@click.option('--verbose', '-v', is_flag=True, help='Show tracebacks of errors.')
+def main(path="", report="", verbose=False):
     """
     Main function of the project. Using an inserted path to the repository
     and a resultant XML filename,
@@ -24,14 +24,29 @@ def main(path="", report=""):
     Args:
         path (str): Path to the repository to analyse.
         report (str): Name for a resultant XML file .
+        verbose (bool): Whether to show the full traceback of an error.
 
     Returns:
         None.
     """
+    # Imported here so that `--help` does not load the whole metrics pipeline
+    # pylint: disable=import-outside-toplevel
+    from python_ext_stats.ext_python_stats import ExtPythonStats
+
     warnings.filterwarnings("ignore", category=SyntaxWarning)
-    stats = ExtPythonStats(path)
-    metrics_report_list = stats.report()
-    stats.print(report, metrics_report_list)
+    try:
+        stats = ExtPythonStats(path)
+        metrics_report_list = stats.report()
+        stats.print(report, metrics_report_list)
+    except SyntaxError as error:
+        if verbose:
+            raise
+        raise click.ClickException(
+            f"Unable to parse presented py file: {error.filename}") from error
+    except (FileNotFoundError, PermissionError) as error:
+        if verbose:
+            raise
+        raise click.ClickException(str(error)) from error
 
 
 if __name__ == "__main__":
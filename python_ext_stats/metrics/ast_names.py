@@ -0,0 +1,82 @@
+"""
+This module provides helpers to read names out of AST nodes
+
+The parser never creates subclasses of node classes, so the helpers compare
+exact node types, which gives the same answer as isinstance without walking
+the MRO. Metrics read names through these helpers instead of repeating the checks.
+"""
+
+# pylint: disable=unidiomatic-typecheck
+from typing import Optional, Set
+import ast
+import sys
+
+
+def dotted_name(node: ast.expr) -> Optional[str]:
+    """
+    Flattens a chain of attributes like `a.b.C` into a dotted name.
+    Dotted names are interned, since the same names recur across a project.
+
+    Args:
+        node (ast.expr): Name or Attribute node.
+
+    Returns:
+        Optional[str]: Dotted name, or None if the chain does not start with a name.
+    """
+    name_type = ast.Name
+    attribute_type = ast.Attribute
+
+    if type(node) is name_type:
+        return node.id
+
+    parts = []
+    while type(node) is attribute_type:
+        parts.append(node.attr)
+        node = node.value
+    if type(node) is not name_type:
+        return None
+
+    parts.append(node.id)
+    parts.reverse()
+    return sys.intern('.'.join(parts))
+
+
+def docstring_text(node: ast.AST) -> Optional[str]:
+    """
+    Gets the raw docstring of a function, class or module without cleaning it up.
+
+    Args:
+        node (ast.AST): Node with a body.
+
+    Returns:
+        Optional[str]: Docstring, or None if the body does not start with a string.
+    """
+    first = node.body[0]
+    if type(first) is not ast.Expr or type(first.value) is not ast.Constant:
+        return None
+    docstring = first.value.value
+    return docstring if type(docstring) is str else None
+
+
+def self_attribute_names(func_node: ast.AST) -> Set[str]:
+    """
+    Collects names of attributes accessed as `self.<name>` anywhere in a method.
+
+    Args:
+        func_node (ast.AST): Method node.
+
+    Returns:
+        Set[str]: names of used attributes
+    """
+    attributes = set()
+    add = attributes.add
+    attribute_type = ast.Attribute
+    name_type = ast.Name
+
+    for node in ast.walk(func_node):
+        if type(node) is attribute_type:
+            value = node.value
+            if type(value) is name_type and value.id == "self":
+                add(node.attr)
+
+    return attributes
@@ -1,10 +1,13 @@
 """Module for calculating average-based metrics in Python projects."""
 
+from dataclasses import dataclass
 from typing import Dict, Any, List
 from pathlib import Path
 import ast
 
+from python_ext_stats.metrics.module_index import module_index
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
+from python_ext_stats.parallel import threaded_map
 
 
 class AverageBasedMetrics(ProjectMetrics):
@@ -22,15 +25,16 @@ class AverageBasedMetrics(ProjectMetrics):
         """
         result_metrics = {}
 
+        counters = _sum_counters(parsed_py_files)
+
         result_metrics["Average Number of nonepmty Lines per PyFile"] = \
             cls.count_average_number_of_lines_per_file(py_files)
         result_metrics["Average Number of Lines per Method/func"] = \
-            cls.count_average_number_of_lines_per_method(parsed_py_files)
+            _ratio(counters.total_lines, counters.total_methods)
         result_metrics["Average Number of Methods per Class"] =  \
-            cls.count_average_number_of_methods_per_class(parsed_py_files)
+            _ratio(counters.methods_per_class, counters.total_classes)
         result_metrics["Average Number of Parameters per Method/Function"] = \
-            cls.count_average_number_of_params_per_method_or_function(
-                parsed_py_files)
+            _ratio(counters.params, counters.total_methods)
 
         return result_metrics
     @staticmethod
@@ -56,17 +60,12 @@ class AverageBasedMetrics(ProjectMetrics):
         Returns:
             float: average number
         """
-        total_lines = 0
         file_count = len(py_files)
 
         if file_count == 0:
             return 0
 
-        for py_file_path in py_files:
-            with open(py_file_path, 'r', encoding='utf-8') as file:
-                for line in file.readlines():
-                    if line.strip():
-                        total_lines += 1
+        total_lines = sum(threaded_map(_count_nonempty_lines, py_files))
 
         return total_lines / file_count
 
@@ -78,22 +77,8 @@ class AverageBasedMetrics(ProjectMetrics):
         Returns:
             float: average number
         """
-        total_lines = 0
-        total_methods = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if node.body:
-                        start_line = node.lineno
-                        end_line = max(
-                            n.lineno for n in ast.walk(node)
-                            if hasattr(n, 'lineno')
-                        )
-                        total_lines += (end_line - start_line)
-                        total_methods += 1
-
-        return total_lines / total_methods if total_methods > 0 else 0
+        counters = _sum_counters(parsed_py_files)
+        return _ratio(counters.total_lines, counters.total_methods)
 
     @staticmethod
     def count_average_number_of_methods_per_class(parsed_py_files: List) -> float:
@@ -103,20 +88,8 @@ class AverageBasedMetrics(ProjectMetrics):
         Returns:
             float: average number
         """
-        total_methods = 0
-        total_classes = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    methods = sum(
-                        1 for subnode in node.body
-                        if isinstance(subnode, ast.FunctionDef)
-                    )
-                    total_methods += methods
-                    total_classes += 1
-
-        return total_methods / total_classes if total_classes > 0 else 0
+        counters = _sum_counters(parsed_py_files)
+        return _ratio(counters.methods_per_class, counters.total_classes)
 
     @staticmethod
     def count_average_number_of_params_per_method_or_function(parsed_py_files: List)\
@@ -127,14 +100,84 @@ class AverageBasedMetrics(ProjectMetrics):
         Returns:
             float: average number
         """
-        total_params = 0
-        total_functions = 0
+        counters = _sum_counters(parsed_py_files)
+        return _ratio(counters.params, counters.total_methods)
+
+
+def _count_nonempty_lines(py_file_path: Path) -> int:
+    """
+    Counts lines holding anything but whitespace. The file is read as text,
+    so any line ending is recognized and unicode whitespace is blank too.
+
+    Returns:
+        int: number of nonempty lines
+    """
+    with open(py_file_path, 'r', encoding='utf-8') as file:
+        return sum(1 for line in file if line.strip())
+
+
+@dataclass
+class _AverageCounters:
+    """
+    Counters of all AST-based average metrics
+    """
+    total_lines: int = 0
+    total_methods: int = 0
+    total_classes: int = 0
+    methods_per_class: int = 0
+    params: int = 0
+
+    def add(self, other: "_AverageCounters") -> None:
+        """
+        Adds counters collected for another module
+        """
+        self.total_lines += other.total_lines
+        self.total_methods += other.total_methods
+        self.total_classes += other.total_classes
+        self.methods_per_class += other.methods_per_class
+        self.params += other.params
 
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    num_params = len(node.args.args)
-                    total_params += num_params
-                    total_functions += 1
 
-        return total_params / total_functions if total_functions > 0 else 0
+def _count_module(tree: ast.Module) -> _AverageCounters:
+    """
+    Collects average metrics counters of a single module from its index.
+    Nested functions count as functions; lambdas and comprehensions do not.
+
+    Returns:
+        _AverageCounters: the module's counters
+    """
+    index = module_index(tree)
+    counters = _AverageCounters()
+
+    counters.total_methods = len(index.func_defs)
+    for node in index.func_defs:
+        counters.total_lines += node.end_lineno - node.lineno
+        counters.params += len(node.args.args)
+
+    counters.total_classes = len(index.methods_by_class)
+    counters.methods_per_class = sum(map(len, index.methods_by_class.values()))
+
+    return counters
+
+
+def _sum_counters(parsed_py_files: List) -> _AverageCounters:
+    """
+    Collects average metrics counters of all modules.
+
+    Returns:
+        _AverageCounters: the summed counters
+    """
+    counters = _AverageCounters()
+    for module in parsed_py_files:
+        counters.add(_count_module(module))
+    return counters
+
+
+def _ratio(total: int, count: int) -> float:
+    """
+    Divides a total by a count, returning 0 for empty counts.
+
+    Returns:
+        float: average number
+    """
+    return total / count if count > 0 else 0
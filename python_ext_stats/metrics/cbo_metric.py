@@ -2,10 +2,12 @@
 This module provides class-based CBO metric
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, List
 from pathlib import Path
 import ast
 
+from python_ext_stats.metrics.ast_names import dotted_name
+from python_ext_stats.metrics.module_index import module_index
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
 
 
@@ -13,6 +15,12 @@ class CBOMetric(ProjectMetrics):
     """
     Class for coupling between objects metric
     """
+    _BUILTINS: FrozenSet[str] = frozenset({
+        'int', 'str', 'list', 'dict', 'bool', 'float', 'tuple', 'set',
+        'bytes', 'bytearray', 'complex', 'frozenset', 'object', 'type',
+        'None', 'True', 'False'
+    })
+
     @classmethod
     def value(cls, parsed_py_files: List = None, py_files: List = None,
               all_files: List = None, repo_path: Path = None) -> Dict[str, Any]:
@@ -43,73 +51,64 @@ class CBOMetric(ProjectMetrics):
         """
         Counts CBO metric, ignoring method calls via object attributes.
         """
-
-        def add_module_classes(module):
-            module_classes = set()
-            for node in ast.walk(module):
-                if isinstance(node, ast.ClassDef):
-                    module_classes.add(node.name)
-            return module_classes
-
-        def add_bases_names(node):
-            bases_names = set()
-            for base in node.bases:
-                current = base
-                parts = []
-                while isinstance(current, ast.Attribute):
-                    parts.append(current.attr)
-                    current = current.value
-                if isinstance(current, ast.Name):
-                    parts.append(current.id)
-                    base_class = '.'.join(reversed(parts))
-                    if base_class not in builtins:
-                        bases_names.add(base_class)
-            return bases_names
-
-        def add_call_names_for_attr(call_names, func):
-            current = func
-            parts = []
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-                full_name = '.'.join(reversed(parts))
-                if full_name in module_classes \
-                    and full_name not in builtins:
-                    call_names.add(full_name)
-
-        def walk_module(module, result, builtins):
-            def add_call_names(func, call_names, builtins):
-                if isinstance(func, ast.Name):
-                    if func.id not in builtins:
-                        call_names.add(func.id)
-
-                elif isinstance(func, ast.Attribute):
-                    add_call_names_for_attr(call_names, func)
-
-            for node in ast.walk(module):
-                if isinstance(node, ast.ClassDef):
-                    class_name = node.name
-                    bases_names = add_bases_names(node)
-
-                    call_names = set()
-                    for stmt in node.body:
-                        for sub_node in ast.walk(stmt):
-                            if isinstance(sub_node, ast.Call):
-                                func = sub_node.func
-
-                                add_call_names(func, call_names, builtins)
-
-                    all_used = bases_names.union(call_names)
-                    result[class_name] = len(all_used)
-
         result = {}
-        builtins = {'int', 'str', 'list', 'dict', 'bool', 'float'}
 
         for module in parsed_py_files:
-            module_classes = add_module_classes(module)
-
-            walk_module(module, result, builtins)
+            result.update(_cbo_for_module(module))
 
         return result
+
+
+def _cbo_for_module(module: ast.Module) -> Dict[str, int]:
+    """
+    Counts CBO metric for every class of a single module.
+
+    Args:
+        module (ast.Module): Parsed module.
+
+    Returns:
+        Dict[str, int]: CBO value for each class name.
+    """
+    builtins = CBOMetric._BUILTINS  # pylint: disable=protected-access
+
+    def add_bases_names(node):
+        bases_names = set()
+        for base in node.bases:
+            base_class = dotted_name(base)
+            if base_class is not None and base_class not in builtins:
+                bases_names.add(base_class)
+        return bases_names
+
+    def add_call_names_for_attr(call_names, func):
+        # A chain can only name a class of the module if it ends with one,
+        # so the chain is not flattened for ordinary method calls
+        if func.attr not in module_classes:
+            return
+        full_name = dotted_name(func)
+        if full_name in module_classes \
+            and full_name not in builtins:
+            call_names.add(full_name)
+
+    def add_call_names(func, call_names):
+        func_type = type(func)
+        if func_type is ast.Name:
+            if func.id not in builtins:
+                call_names.add(func.id)
+
+        elif func_type is ast.Attribute:
+            add_call_names_for_attr(call_names, func)
+
+    index = module_index(module)
+    module_classes = index.class_names
+
+    result = {}
+
+    for node in index.class_defs:
+        used_names = add_bases_names(node)
+
+        for call in index.calls_by_class[node]:
+            add_call_names(call.func, used_names)
+
+        result[node.name] = len(used_names)
+
+    return result
@@ -2,10 +2,12 @@
 This module provides class metrics
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List, Tuple
 from pathlib import Path
 import ast
 
+from python_ext_stats.metrics.module_index import module_index
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
 
 
@@ -23,15 +25,12 @@ class ClassMetrics(ProjectMetrics):
             Dict: dict of calculated dependency and coupling metrics
         """
         result_metrics = {}
+        counters = _collect(parsed_py_files)
 
-        result_metrics["Method Hiding Factor"] = \
-            cls.calculate_method_hiding_factor(parsed_py_files)
-        result_metrics["Attribute Hiding Factor"] = \
-            cls.calculate_attribute_hiding_factor(parsed_py_files)
-        result_metrics["Method Inheritance Factor"] = \
-            cls.calculate_method_inheritance_factor(parsed_py_files)
-        result_metrics["Polymorphism Factor"] = \
-            cls.calculate_method_polymorphism_factor(parsed_py_files)
+        result_metrics["Method Hiding Factor"] = counters.method_hiding_factor()
+        result_metrics["Attribute Hiding Factor"] = counters.attribute_hiding_factor()
+        result_metrics["Method Inheritance Factor"] = counters.inheritance
+        result_metrics["Polymorphism Factor"] = counters.polymorphism
         result_metrics["Depth Of Inheritance Tree"] = \
             cls.calculate_depth_of_inheritance_tree(parsed_py_files)
         return result_metrics
@@ -58,24 +57,7 @@ class ClassMetrics(ProjectMetrics):
         Returns:
             float: calculated method-hiding factor
         """
-        def func_behaviour(subnode, private_method_num, total_method_num):
-            if isinstance(subnode, ast.FunctionDef):
-                if subnode.name.startswith("_"):
-                    private_method_num += 1
-                total_method_num += 1
-            return total_method_num, private_method_num
-
-        private_method_num = 0
-        total_method_num = 0
-
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, (ast.ClassDef)):
-                    for subnode in node.body:
-                        total_method_num, private_method_num =\
-                            func_behaviour(subnode, private_method_num, total_method_num)
-
-        return private_method_num / total_method_num if total_method_num else 0
+        return _collect(parsed_py_files).method_hiding_factor()
 
     @staticmethod
     def calculate_attribute_hiding_factor(parsed_py_files: List) -> float:
@@ -85,33 +67,7 @@ class ClassMetrics(ProjectMetrics):
         Returns:
             float: calculated attribute-hiding factor
         """
-        def add_attr_nums(subnode, private_attr_num, total_attr_num):
-            if isinstance(subnode, ast.Assign):
-                for target in subnode.targets:
-                    if isinstance(target, ast.Name) and target.id.startswith("_"):
-                        private_attr_num += 1
-
-                total_attr_num += 1
-
-            elif isinstance(subnode, ast.AnnAssign):
-                if isinstance(subnode.target, ast.Name) \
-                    and subnode.target.id.startswith("_"):
-                    private_attr_num += 1
-
-                total_attr_num += 1
-            return private_attr_num, total_attr_num
-
-        private_attr_num = 0
-        total_attr_num = 0
-
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, (ast.ClassDef)):
-                    for subnode in node.body:
-                        private_attr_num, total_attr_num = \
-                        add_attr_nums(subnode, private_attr_num, total_attr_num)
-
-        return private_attr_num / total_attr_num if total_attr_num else 0.0
+        return _collect(parsed_py_files).attribute_hiding_factor()
 
     @staticmethod
     def calculate_method_inheritance_factor(parsed_py_files: List) -> Dict:
@@ -122,44 +78,7 @@ class ClassMetrics(ProjectMetrics):
         Returns:
             Dict: calculated ratios of inherited methods for each class 
         """
-
-        def behave_other_nodes(tree, inherited_methods_num, all_methods):
-            for other_node in ast.walk(tree):
-                if isinstance(other_node, ast.ClassDef) and other_node.name in base_names:
-                    for subnode in other_node.body:
-                        if isinstance(subnode, ast.FunctionDef):
-                            inherited_methods_num += 1
-                            all_methods.add(subnode.name)
-            return inherited_methods_num
-
-        result_inheritance = {}
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    inherited_methods_num = 0
-                    all_methods = set()
-                    base_names = []
-                    for base in node.bases:
-                        if isinstance(base, ast.Name):
-                            base_names.append(base.id)
-                        elif isinstance(base, ast.Attribute):
-                            base_names.append(base.attr)
-
-                    for subnode in node.body:
-                        if isinstance(subnode, ast.FunctionDef):
-                            all_methods.add(subnode.name)
-
-                    inherited_methods_num = \
-                    behave_other_nodes(tree, inherited_methods_num, all_methods)
-
-                    result_inheritance[node.name] = (
-                        inherited_methods_num / len(all_methods)
-                        if len(all_methods) > 0
-                        else 0.0
-                    )
-
-        return result_inheritance
+        return _collect(parsed_py_files).inheritance
 
     @staticmethod
     def calculate_method_polymorphism_factor(parsed_py_files: List) -> Dict:
@@ -170,46 +89,7 @@ class ClassMetrics(ProjectMetrics):
         Returns:
             Dict: calculated ratios of overriden methods for each class 
         """
-        def behave_other_node(tree, overriden_methods_num, all_methods):
-            for other_node in ast.walk(tree):
-                if isinstance(other_node, ast.ClassDef) and other_node.name in base_names:
-                    for subnode in other_node.body:
-                        if isinstance(subnode, ast.FunctionDef):
-                            if subnode.name in init_methods:
-                                overriden_methods_num += 1
-                            all_methods.add(subnode.name)
-            return overriden_methods_num
-
-        result_polymorphism = {}
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    overriden_methods_num = 0
-                    all_methods = set()
-                    init_methods = []
-
-                    base_names = []
-                    for base in node.bases:
-                        if isinstance(base, ast.Name):
-                            base_names.append(base.id)
-                        elif isinstance(base, ast.Attribute):
-                            base_names.append(base.attr)
-
-                    for subnode in node.body:
-                        if isinstance(subnode, ast.FunctionDef):
-                            init_methods.append(subnode.name)
-                            all_methods.add(subnode.name)
-
-                    overriden_methods_num = \
-                    behave_other_node(tree, overriden_methods_num, all_methods)
-
-                    if all_methods:
-                        result_polymorphism[node.name] = overriden_methods_num / len(all_methods)
-                    else:
-                        result_polymorphism[node.name] = 0.0
-
-        return result_polymorphism
+        return _collect(parsed_py_files).polymorphism
 
     @staticmethod
     def calculate_depth_of_inheritance_tree(parsed_py_files: List) -> int:
@@ -230,43 +110,253 @@ class ClassMetrics(ProjectMetrics):
                 return get_base_name(base_node.func)
             return "UnknownBase"
 
-        def pseudo_dfs(temp_ver, visited, inheritance_depth, edges):
-            """Calculates depth of inh. tree."""
-            if visited.get(temp_ver, False):
-                return
-
-            visited[temp_ver] = True
-            max_child_depth = 0
-
-            for child in edges.get(temp_ver, []):
-                if child not in visited:
-                    pseudo_dfs(child, visited, inheritance_depth, edges)
-                max_child_depth = max(max_child_depth, inheritance_depth.get(child, 0))
-
-            inheritance_depth[temp_ver] = max_child_depth + 1
+        def iterative_dfs(start, inheritance_depth, edges):
+            """Calculates depth of inh. tree in DFS post-order without recursion."""
+            stack = [(start, iter(edges[start]))]
+            in_progress = {start}
+
+            while stack:
+                temp_ver, children = stack[-1]
+
+                for child in children:
+                    if child not in inheritance_depth and child not in in_progress:
+                        in_progress.add(child)
+                        stack.append((child, iter(edges[child])))
+                        break
+                else:
+                    stack.pop()
+                    in_progress.discard(temp_ver)
+                    inheritance_depth[temp_ver] = 1 + max(
+                        (inheritance_depth.get(child, 0) for child in edges[temp_ver]),
+                        default=0
+                    )
 
         edges = {}
         class_names = set()
 
         for module in parsed_py_files:
-            for node in ast.walk(module):
-                if isinstance(node, ast.ClassDef):
-                    class_names.add(node.name)
+            class_names.update(module_index(module).class_names)
 
         for module in parsed_py_files:
-            for node in ast.walk(module):
-                if isinstance(node, ast.ClassDef):
-                    edges[node.name] = []
-                    for base in node.bases:
-                        base_name = get_base_name(base)
-                        if base_name in class_names:
-                            edges[node.name].append(base_name)
+            for node in module_index(module).class_defs:
+                edges[node.name] = []
+                for base in node.bases:
+                    base_name = get_base_name(base)
+                    if base_name in class_names:
+                        edges[node.name].append(base_name)
 
         inheritance_depth = {}
-        visited = {cls: False for cls in edges}
 
         for cls in edges:
-            if not visited[cls]:
-                pseudo_dfs(cls, visited, inheritance_depth, edges)
+            if cls not in inheritance_depth:
+                iterative_dfs(cls, inheritance_depth, edges)
 
         return max(inheritance_depth.values(), default=0)
+
+
+@dataclass
+class _ClassCounters:
+    """
+    Counters of all per-module class metrics
+    """
+    private_methods: int = 0
+    methods: int = 0
+    private_attributes: int = 0
+    attributes: int = 0
+    inheritance: Dict[str, float] = field(default_factory=dict)
+    polymorphism: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, other: "_ClassCounters") -> None:
+        """
+        Adds counters collected for another module
+        """
+        self.private_methods += other.private_methods
+        self.methods += other.methods
+        self.private_attributes += other.private_attributes
+        self.attributes += other.attributes
+        self.inheritance.update(other.inheritance)
+        self.polymorphism.update(other.polymorphism)
+
+    def method_hiding_factor(self) -> float:
+        """
+        Calculates the ratio of private methods to total methods.
+
+        Returns:
+            float: method-hiding factor from 0 to 1
+        """
+        return self.private_methods / self.methods if self.methods else 0
+
+    def attribute_hiding_factor(self) -> float:
+        """
+        Calculates the ratio of private attributes to total attributes.
+
+        Returns:
+            float: attribute-hiding factor from 0 to 1
+        """
+        return self.private_attributes / self.attributes if self.attributes else 0.0
+
+
+def _count_module(tree: ast.Module) -> _ClassCounters:
+    """
+    Collects all per-module class metrics at once.
+
+    Returns:
+        _ClassCounters: counters of the module
+    """
+    private_methods, methods = _method_hiding_for_module(tree)
+    private_attributes, attributes = _attribute_hiding_for_module(tree)
+
+    return _ClassCounters(private_methods, methods, private_attributes, attributes,
+                          _method_inheritance_for_module(tree),
+                          _method_polymorphism_for_module(tree))
+
+
+def _collect(parsed_py_files: List) -> _ClassCounters:
+    """
+    Collects class counters of all modules.
+
+    Returns:
+        _ClassCounters: the summed counters
+    """
+    counters = _ClassCounters()
+    for module in parsed_py_files:
+        counters.add(_count_module(module))
+    return counters
+
+
+def _get_base_names(node: ast.ClassDef) -> List[str]:
+    """
+    Collects names of direct base classes.
+
+    Returns:
+        List[str]: names of base classes
+    """
+    base_names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            base_names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            base_names.append(base.attr)
+    return base_names
+
+
+def _iter_base_methods(tree: ast.Module, base_names: List[str]) -> Iterator[str]:
+    """
+    Yields names of methods defined in the module's classes listed as bases.
+
+    Returns:
+        Iterator[str]: names of base classes' methods
+    """
+    index = module_index(tree)
+
+    for base_name in dict.fromkeys(base_names):
+        for other_node in index.classes_by_name.get(base_name, ()):
+            for method in index.methods_by_class[other_node]:
+                yield method.name
+
+
+def _method_hiding_for_module(parsed_ast: ast.Module) -> Tuple[int, int]:
+    """
+    Counts private and total methods of a single module.
+
+    Returns:
+        Tuple[int, int]: number of private methods and total number of methods
+    """
+    private_method_num = 0
+    total_method_num = 0
+
+    for methods in module_index(parsed_ast).methods_by_class.values():
+        for method in methods:
+            if method.name.startswith("_"):
+                private_method_num += 1
+            total_method_num += 1
+
+    return private_method_num, total_method_num
+
+
+def _attribute_hiding_for_module(parsed_ast: ast.Module) -> Tuple[int, int]:
+    """
+    Counts private and total class attributes of a single module.
+
+    Returns:
+        Tuple[int, int]: number of private attributes and total number of attributes
+    """
+    private_attr_num = 0
+    total_attr_num = 0
+
+    for node in module_index(parsed_ast).class_defs:
+        for subnode in node.body:
+            if isinstance(subnode, ast.Assign):
+                for target in subnode.targets:
+                    if isinstance(target, ast.Name) and target.id.startswith("_"):
+                        private_attr_num += 1
+
+                total_attr_num += 1
+
+            elif isinstance(subnode, ast.AnnAssign):
+                if isinstance(subnode.target, ast.Name) \
+                    and subnode.target.id.startswith("_"):
+                    private_attr_num += 1
+
+                total_attr_num += 1
+
+    return private_attr_num, total_attr_num
+
+
+def _method_inheritance_for_module(tree: ast.Module) -> Dict[str, float]:
+    """
+    Calculates the ratio of inherited methods for each class of a single module.
+
+    Returns:
+        Dict[str, float]: ratio of inherited methods for each class
+    """
+    result_inheritance = {}
+
+    index = module_index(tree)
+
+    for node in index.class_defs:
+        inherited_methods_num = 0
+        all_methods = {method.name for method in index.methods_by_class[node]}
+        base_names = _get_base_names(node)
+
+        for base_method in _iter_base_methods(tree, base_names):
+            inherited_methods_num += 1
+            all_methods.add(base_method)
+
+        result_inheritance[node.name] = (
+            inherited_methods_num / len(all_methods)
+            if len(all_methods) > 0
+            else 0.0
+        )
+
+    return result_inheritance
+
+
+def _method_polymorphism_for_module(tree: ast.Module) -> Dict[str, float]:
+    """
+    Calculates the ratio of overriden methods for each class of a single module.
+
+    Returns:
+        Dict[str, float]: ratio of overriden methods for each class
+    """
+    result_polymorphism = {}
+
+    index = module_index(tree)
+
+    for node in index.class_defs:
+        overriden_methods_num = 0
+        init_methods = [method.name for method in index.methods_by_class[node]]
+        all_methods = set(init_methods)
+        base_names = _get_base_names(node)
+
+        for base_method in _iter_base_methods(tree, base_names):
+            if base_method in init_methods:
+                overriden_methods_num += 1
+            all_methods.add(base_method)
+
+        if all_methods:
+            result_polymorphism[node.name] = overriden_methods_num / len(all_methods)
+        else:
+            result_polymorphism[node.name] = 0.0
+
+    return result_polymorphism
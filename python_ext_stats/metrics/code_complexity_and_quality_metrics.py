@@ -2,15 +2,29 @@
 This module privedes specific code complexity and quality netrics
 """
 
-from typing import Dict, Any, List, Set
+from collections import Counter
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 import ast
-import sys
+import functools
+import logging
+import os
+import radon
 from radon.visitors import HalsteadVisitor
 import vulture
 
+from python_ext_stats import disk_cache
+from python_ext_stats.metrics.ast_names import self_attribute_names
+from python_ext_stats.metrics.cyclomatic import cyclomatic_complexity
+from python_ext_stats.metrics.module_index import module_index
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
+from python_ext_stats.parallel import parallel_map, submit
+from python_ext_stats.parser_cache import parse_file
 
+logger = logging.getLogger(__name__)
+
+# Halstead counts come from radon's visitor, so stored results are kept per radon version
+_HALSTEAD_CACHE_KIND = f"halstead-radon{radon.__version__}"
 
 class CodeComplexityAndQualityMetrics(ProjectMetrics):
     """
@@ -26,12 +40,14 @@ class CodeComplexityAndQualityMetrics(ProjectMetrics):
             List: list of calculated code complexity and quality metrics
         """
         result_metrics = {}
+        # Vulture only needs file paths, so it runs in a worker alongside the other metrics
+        dead_code = submit(cls.find_dead_code, py_files)
 
         result_metrics["Cyclomatic Complexity"] = \
             cls.calculate_cyclomatic_complexity(parsed_py_files, py_files)
         result_metrics["Halstead Complexity"] = cls.calculate_halstead_complexity(py_files)
         result_metrics["LCOM"] = cls.calculate_lcom(parsed_py_files)
-        result_metrics["Dead code: unused objects"] = cls.find_dead_code(py_files)
+        result_metrics["Dead code: unused objects"] = dead_code.result()
 
         return result_metrics
 
@@ -59,51 +75,39 @@ class CodeComplexityAndQualityMetrics(ProjectMetrics):
             Dict[str, Dict[str, int]]: Dictionary where keys are filenames and values are
                                       dictionaries of {function_name: complexity}
         """
-        results = {}
-
         assert(len(parsed_py_files) == len(py_files))
 
-        for i, parsed_file in enumerate(parsed_py_files):
-            file_complexities = {}
-
-            for node in ast.walk(parsed_file):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    visitor = CyclomaticComplexityVisitor()
-                    try:
-                        visitor.visit(node)
-                    except RecursionError:
-                        print("ERROR caused by RECURSION depth")
-                        sys.exit()
-                    file_complexities[node.name] = visitor.complexity
+        if disk_cache.cache_dir() is None:
+            return {py_file: _cyclomatic_complexity_for_module(parsed_file)
+                    for py_file, parsed_file in zip(py_files, parsed_py_files)}
 
-            results[py_files[i]] = file_complexities
-
-        return results
+        return {py_file: _cached_cyclomatic_complexity(py_file, parsed_file)
+                for py_file, parsed_file in zip(py_files, parsed_py_files)}
 
     @staticmethod
     def calculate_halstead_complexity(py_files: List) -> List[Dict[str, int]]:
         """
         Calculates Halstead complexity for each py file in the repository.
+        Files nested too deeply for the radon visitor are left out and reported in one warning.
 
         Returns:
             List[Dict]: List of dictionaries with Halstead metrics for each file.
         """
-        halstead_metrics = {}
+        results = parallel_map(_halstead_for_file, py_files)
 
-        for py_file in py_files:
-            with open(py_file, "r", encoding="utf-8") as file:
-                code = file.read()
-
-            visitor = HalsteadVisitor.from_code(code)
-            metrics = {
-                "n1": visitor.distinct_operators,
-                "n2": visitor.distinct_operands,
-                "N1": visitor.operators,
-                "N2": visitor.operands
-            }
-            halstead_metrics[py_file] = metrics
+        halstead = {}
+        failed_files = []
+        for py_file, result in zip(py_files, results):
+            if result is None:
+                failed_files.append(str(py_file))
+            else:
+                halstead[py_file] = result
+
+        if failed_files:
+            logger.warning("Halstead complexity skipped for %d files exceeding recursion depth: %s",
+                           len(failed_files), ", ".join(failed_files))
 
-        return halstead_metrics
+        return halstead
 
     @staticmethod
     def calculate_lcom(parsed_py_files: List) -> Dict[str, Any]:
@@ -121,85 +125,11 @@ class CodeComplexityAndQualityMetrics(ProjectMetrics):
                 ...
             }
         """
-
-        class _AttributeVisitor(ast.NodeVisitor):
-            """
-            Class redefined for attributes collection
-            """
-            def __init__(self):
-                """
-                subclass init
-                """
-                self.attributes: Set[str] = set()
-
-            # pylint: disable=C0103
-            def visit_Attribute(self, node: ast.Attribute) -> None:
-                """
-                method to specify behaviour while visiting an Attribute
-                """
-                if isinstance(node.value, ast.Name) and node.value.id == "self":
-                    self.attributes.add(node.attr)
-                self.generic_visit(node)
-
-            # pylint: disable=C0103
-            def visit_Assign(self, node: ast.Assign) -> None:
-                """assign visit method reinterpretation"""
-                for target in node.targets:
-                    if isinstance(target, ast.Attribute):
-                        if isinstance(target.value, ast.Name) and target.value.id == "self":
-                            self.attributes.add(target.attr)
-                self.generic_visit(node)
-
-        def run_methods_lcom(methods):
-            lcom = 0
-            if len(methods) > 1:
-                p = 0
-                q = 0
-
-                len_m = len(methods)
-
-                for i in range(len_m):
-                    for j in range(i + 1, len(methods)):
-                        attrs_i = methods[i]["attributes"]
-                        attrs_j = methods[j]["attributes"]
-
-                        if attrs_i.isdisjoint(attrs_j):
-                            p += 1
-                        else:
-                            q += 1
-
-                lcom = p - q if p > q else 0
-            return lcom
-
         lcom_results = {}
 
+        # Modules are merged in order, so a later class of the same name still wins
         for parsed_file in parsed_py_files:
-            for node in ast.walk(parsed_file):
-                if isinstance(node, ast.ClassDef):
-                    class_name = node.name
-                    methods = []
-
-                    for child in node.body:
-                        if isinstance(child, ast.FunctionDef):
-                            method_name = child.name
-                            visitor = _AttributeVisitor()
-                            visitor.visit(child)
-                            methods.append({
-                                "name": method_name,
-                                "attributes": visitor.attributes
-                            })
-
-                    lcom = run_methods_lcom(methods)
-
-                    all_attributes = set()
-                    for method in methods:
-                        all_attributes.update(method["attributes"])
-
-                    lcom_results[class_name] = {
-                        "lcom": lcom,
-                        "methods": len(methods),
-                        "attributes": list(all_attributes)
-                    }
+            lcom_results.update(_lcom_for_module(parsed_file))
 
         return lcom_results
 
@@ -208,126 +138,166 @@ class CodeComplexityAndQualityMetrics(ProjectMetrics):
         """
         Detects dead code for each file in a presented repo
 
+        Unchanged sets of files are not scanned again.
+
         Returns:
             List: pieces of unsued code
         """
+        fingerprint = []
+        for py_file in py_files:
+            stat = os.stat(py_file)
+            fingerprint.append((os.fspath(py_file), stat.st_mtime_ns, stat.st_size))
 
-        v = vulture.Vulture()
-        v.scavenge(py_files)
+        return list(_find_dead_code_cached(tuple(fingerprint)))
 
-        return v.get_unused_code()
 
+def _lcom_for_module(parsed_file: ast.Module) -> Dict[str, Dict[str, Any]]:
+    """
+    Calculates LCOM metric for each class of a single module.
 
-class CyclomaticComplexityVisitor(ast.NodeVisitor):
+    Returns:
+        Dict[str, Dict[str, Any]]: lcom, number of methods and attributes for each class name
     """
-    Specific class that describes behavour in a certain node
+    def run_methods_lcom(attribute_sets):
+        len_m = len(attribute_sets)
+        if len_m < 2:
+            return 0
+
+        q = _count_sharing_pairs(attribute_sets)
+        p = len_m * (len_m - 1) // 2 - q
+
+        return p - q if p > q else 0
+
+    lcom_results = {}
+
+    for node, class_methods in module_index(parsed_file).methods_by_class.items():
+        attribute_sets = [self_attribute_names(child) for child in class_methods]
+
+        lcom_results[node.name] = {
+            "lcom": run_methods_lcom(attribute_sets),
+            "methods": len(attribute_sets),
+            "attributes": list(set().union(*attribute_sets))
+        }
+
+    return lcom_results
+
+
+def _count_sharing_pairs(attribute_sets: List[Set[str]]) -> int:
     """
-    def __init__(self):
-        """
-        class init
-        """
-        self.complexity = 1
+    Counts pairs of methods using at least one common attribute.
 
-    # pylint: disable=C0103
-    def visit_If(self, node):
-        """
-        method to visit If
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Attribute sets are encoded as integer bitmasks, and methods using the same
+    attributes are compared once per group: all pairs inside a group share
+    attributes unless the set is empty.
 
-    # pylint: disable=C0103
-    def visit_Else(self, node):
-        """
-        method to visit Else
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Returns:
+        int: number of pairs sharing attributes
+    """
+    attr_ids = {}
+    mask_counts = Counter()
+    for attributes in attribute_sets:
+        mask = 0
+        for attr in attributes:
+            mask |= 1 << attr_ids.setdefault(attr, len(attr_ids))
+        mask_counts[mask] += 1
+
+    groups = list(mask_counts.items())
+    sharing_pairs = 0
+    for i, (mask_i, count_i) in enumerate(groups):
+        if mask_i:
+            sharing_pairs += count_i * (count_i - 1) // 2
+            for mask_j, count_j in groups[i + 1:]:
+                if mask_i & mask_j:
+                    sharing_pairs += count_i * count_j
+
+    return sharing_pairs
+
+
+@functools.lru_cache(maxsize=16)
+def _find_dead_code_cached(fingerprint: Tuple[Tuple[str, int, int], ...]) -> Tuple:
+    """
+    Runs vulture over a set of files, memoized by their paths and stats.
 
-    # pylint: disable=C0103
-    def visit_For(self, node):
-        """
-        method to visit FOR
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Args:
+        fingerprint (Tuple): Path, modification time and size of each file.
 
-    # pylint: disable=C0103
-    def visit_AsyncFor(self, node):
-        """
-        method to visit ASYNCFOR
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Returns:
+        Tuple: pieces of unused code
+    """
+    v = vulture.Vulture()
+    v.scavenge([path for path, _, _ in fingerprint])
 
-    # pylint: disable=C0103
-    def visit_While(self, node):
-        """
-        method to visit WHILE
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    return tuple(v.get_unused_code())
 
-    # pylint: disable=C0103
-    def visit_With(self, node):
-        """
-        method to visit WITH
-        """
-        self.complexity += 1
-        self.generic_visit(node)
 
-    # pylint: disable=C0103
-    def visit_AsyncWith(self, node):
-        """
-        method to visit AsyncWith
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+def _cyclomatic_complexity_for_module(parsed_file: ast.Module) -> Dict[str, int]:
+    """
+    Calculates cyclomatic complexity for each func of a single module.
 
-    # pylint: disable=C0103
-    def visit_ExceptHandler(self, node):
-        """
-        method to visit EXCEPTHANDLER
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Returns:
+        Dict[str, int]: complexity for each function name
+    """
+    file_complexities = {}
 
-    # pylint: disable=C0103
-    def visit_BoolOp(self, node):
-        """
-        method to visit BOOL OP.
-        """
-        self.complexity += len(node.values) - 1
-        self.generic_visit(node)
+    for node in module_index(parsed_file).all_func_defs:
+        file_complexities[node.name] = cyclomatic_complexity(node)
 
-    # pylint: disable=C0103
-    def visit_IfExp(self, node):
-        """
-        method to visit IFExp
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    return file_complexities
 
-    # pylint: disable=C0103
-    def visit_comprehension(self, node):
-        """
-        method to visit comprehension
-        """
-        self.complexity += len(node.ifs)
-        self.generic_visit(node)
 
-    # pylint: disable=C0103
-    def visit_Raise(self, node):
-        """
-        method to visit RAISE
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+def _cached_cyclomatic_complexity(py_file: Path, parsed_file: ast.Module) -> Dict[str, int]:
+    """
+    Calculates cyclomatic complexity of a module, reusing the stored result for its content.
 
-    # pylint: disable=C0103
-    def visit_Assert(self, node):
-        """
-        method to visit ASSERT
-        """
-        self.complexity += 1
-        self.generic_visit(node)
+    Returns:
+        Dict[str, int]: complexity for each function name
+    """
+    return disk_cache.cached("cc", py_file,
+                             lambda: _cyclomatic_complexity_for_module(parsed_file))
+
+
+def _is_operator_free(stmt: ast.stmt) -> bool:
+    """
+    Checks whether a top-level statement trivially has no Halstead operators:
+    an import, `pass` or a bare constant such as a docstring.
+
+    Returns:
+        bool: True if the statement cannot contribute to Halstead metrics
+    """
+    if isinstance(stmt, (ast.Import, ast.ImportFrom, ast.Pass)):
+        return True
+    return isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)
+
+
+def _halstead_for_file(py_file: Path) -> Optional[Dict[str, int]]:
+    """
+    Calculates Halstead metrics of a single py file, reusing the stored result for its content.
+
+    Returns:
+        Optional[Dict[str, int]]: numbers of distinct and total operators and operands,
+                                  or None if the file is nested too deeply to be visited
+    """
+    try:
+        return disk_cache.cached(_HALSTEAD_CACHE_KIND, py_file,
+                                 lambda: _halstead_for_tree(parse_file(py_file)))
+    except RecursionError:
+        return None
+
+
+def _halstead_for_tree(tree: ast.Module) -> Dict[str, int]:
+    """
+    Calculates Halstead metrics of a parsed module.
+
+    Returns:
+        Dict[str, int]: numbers of distinct and total operators and operands
+    """
+    if all(_is_operator_free(stmt) for stmt in tree.body):
+        return {"n1": 0, "n2": 0, "N1": 0, "N2": 0}
+
+    visitor = HalsteadVisitor.from_ast(tree)
+    return {
+        "n1": visitor.distinct_operators,
+        "n2": visitor.distinct_operands,
+        "N1": visitor.operators,
+        "N2": visitor.operands
+    }
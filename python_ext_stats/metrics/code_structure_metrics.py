@@ -1,11 +1,13 @@
 """
 Module that specifies code structure metrics
 """
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List
 from pathlib import Path
 import ast
 
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
+from python_ext_stats.metrics.statement_walk import walk_statements
 
 
 class CodeStructuresMetrics(ProjectMetrics):
@@ -22,20 +24,15 @@ class CodeStructuresMetrics(ProjectMetrics):
             Dict: dict of calculated code structures metrics
         """
         result_metrics = {}
+        counters = _collect(parsed_py_files)
 
-        result_metrics["Number of Classes"] = cls.count_number_of_classes(parsed_py_files)
-        result_metrics["Number of Methods"] = \
-            cls.count_number_of_methods_in_classes(parsed_py_files)
-        result_metrics["Number of Static Methods"] = \
-            cls.count_number_of_static_methods_in_classes(parsed_py_files)
-        result_metrics["Maximum Number of Method Parameters"] = \
-            cls.count_max_number_of_method_params(parsed_py_files)
-        result_metrics["Maximum Method Length"] = \
-            cls.count_max_method_length(parsed_py_files)
-        result_metrics["Number of Decorators"] = \
-            cls.count_number_of_decorators(parsed_py_files)
-        result_metrics["Number of Constants in Files"] = \
-            cls.count_number_of_constants(parsed_py_files)
+        result_metrics["Number of Classes"] = counters.classes
+        result_metrics["Number of Methods"] = counters.methods
+        result_metrics["Number of Static Methods"] = counters.static_methods
+        result_metrics["Maximum Number of Method Parameters"] = counters.max_params
+        result_metrics["Maximum Method Length"] = counters.max_method_length
+        result_metrics["Number of Decorators"] = counters.decorators
+        result_metrics["Number of Constants in Files"] = counters.constants
 
         return result_metrics
 
@@ -64,11 +61,7 @@ class CodeStructuresMetrics(ProjectMetrics):
         Returns:
             int: The total number of classes found in all Python files.
         """
-        return sum(
-            isinstance(node, ast.ClassDef)
-            for tree in parsed_py_files
-            for node in ast.walk(tree)
-        )
+        return _collect(parsed_py_files).classes
 
     @staticmethod
     def count_number_of_methods_in_classes(parsed_py_files: Dict) -> int:
@@ -78,16 +71,7 @@ class CodeStructuresMetrics(ProjectMetrics):
         Returns:
             int: The total count of methods in all classes.
         """
-        method_count = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    for class_node in node.body:
-                        if isinstance(class_node, ast.FunctionDef):
-                            method_count += 1
-
-        return method_count
+        return _collect(parsed_py_files).methods
 
     @staticmethod
     def count_number_of_static_methods_in_classes(parsed_py_files: Dict) -> int:
@@ -97,16 +81,7 @@ class CodeStructuresMetrics(ProjectMetrics):
         Returns:
             int: The total count of static methods across all classes.
         """
-        static_methods_count = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if any(isinstance(decorator, ast.Name) and decorator.id == 'staticmethod'\
-                            for decorator in node.decorator_list):
-                        static_methods_count += 1
-
-        return static_methods_count
+        return _collect(parsed_py_files).static_methods
 
     @staticmethod
     def count_max_number_of_method_params(parsed_py_files: Dict) -> int:
@@ -116,41 +91,14 @@ class CodeStructuresMetrics(ProjectMetrics):
         Returns:
             int: The maximum number of parameters for any method in the parsed files.
         """
-        max_params = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    num_params = len(node.args.args)
-                    max_params = max(max_params, num_params)
-
-        return max_params
+        return _collect(parsed_py_files).max_params
 
     @staticmethod
     def count_max_method_length(parsed_py_files: List) -> int:
         """
         Counts max method length across all py files
         """
-        max_length = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    try:
-                        start_line = node.lineno
-                        if hasattr(node, 'end_lineno'):
-                            end_line = node.end_lineno
-                        else:
-                            end_line = start_line
-
-                        method_length = end_line - start_line
-                        max_length = max(max_length, method_length)
-
-                    except AttributeError as e:
-                        print(f"Error processing method: {e}")
-                        continue
-
-        return max_length
+        return _collect(parsed_py_files).max_method_length
 
     @staticmethod
     def count_number_of_decorators(parsed_py_files: Dict) -> int:
@@ -162,14 +110,7 @@ class CodeStructuresMetrics(ProjectMetrics):
             int: The total number of decorators applied to functions
                  and classes in the parsed files.
         """
-        count = 0
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                    count += len(node.decorator_list)
-
-        return count
+        return _collect(parsed_py_files).decorators
 
     @staticmethod
     def count_number_of_constants(parsed_py_files: Dict) -> int:
@@ -179,13 +120,95 @@ class CodeStructuresMetrics(ProjectMetrics):
         Returns:
             int: The total number of constants assigned in the parsed files.
         """
-        constant_count = 0
+        return _collect(parsed_py_files).constants
+
+
+@dataclass
+class _StructureCounters:
+    """
+    Counters of all code structure metrics
+    """
+    classes: int = 0
+    methods: int = 0
+    static_methods: int = 0
+    max_params: int = 0
+    max_method_length: int = 0
+    decorators: int = 0
+    constants: int = 0
+
+    def add(self, other: "_StructureCounters") -> None:
+        """
+        Adds counters collected for another module
+        """
+        self.classes += other.classes
+        self.methods += other.methods
+        self.static_methods += other.static_methods
+        self.max_params = max(self.max_params, other.max_params)
+        self.max_method_length = max(self.max_method_length, other.max_method_length)
+        self.decorators += other.decorators
+        self.constants += other.constants
 
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and isinstance(node.value, ast.Constant):
-                            constant_count += 1
 
-        return constant_count
+def _on_class(node: ast.ClassDef, counters: _StructureCounters) -> None:
+    """Counts a class, its decorators, its methods and static methods."""
+    counters.classes += 1
+    counters.decorators += len(node.decorator_list)
+    for class_node in node.body:
+        if isinstance(class_node, ast.FunctionDef):
+            counters.methods += 1
+            if any(isinstance(decorator, ast.Name) and decorator.id == 'staticmethod'
+                   for decorator in class_node.decorator_list):
+                counters.static_methods += 1
+
+
+def _on_function(node: ast.FunctionDef, counters: _StructureCounters) -> None:
+    """Counts parameters and length of a function."""
+    counters.max_params = max(counters.max_params, len(node.args.args))
+    _on_async_function(node, counters)
+
+
+def _on_async_function(node: ast.AsyncFunctionDef, counters: _StructureCounters) -> None:
+    """Counts decorators and length of a function of any kind."""
+    counters.decorators += len(node.decorator_list)
+    counters.max_method_length = max(counters.max_method_length,
+                                     node.end_lineno - node.lineno)
+
+
+def _on_assign(node: ast.Assign, counters: _StructureCounters) -> None:
+    """Counts names a constant is assigned to."""
+    if isinstance(node.value, ast.Constant):
+        counters.constants += sum(isinstance(target, ast.Name) for target in node.targets)
+
+
+_HANDLERS: Dict[type, Callable[..., None]] = {
+    ast.ClassDef: _on_class,
+    ast.FunctionDef: _on_function,
+    ast.AsyncFunctionDef: _on_async_function,
+    ast.Assign: _on_assign,
+}
+
+
+def _count_module(tree: ast.Module) -> _StructureCounters:
+    """
+    Collects code structure counters of a single module in one traversal
+    of its statements.
+
+    Returns:
+        _StructureCounters: the module's counters
+    """
+    counters = _StructureCounters()
+    walk_statements(tree, _HANDLERS, counters)
+    return counters
+
+
+def _collect(parsed_py_files: List) -> _StructureCounters:
+    """
+    Collects code structure counters of all modules.
+
+    Returns:
+        _StructureCounters: the summed counters
+    """
+    counters = _StructureCounters()
+    for module in parsed_py_files:
+        counters.add(_count_module(module))
+    return counters
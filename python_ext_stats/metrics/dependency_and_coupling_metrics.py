@@ -2,10 +2,12 @@
 This module provides dependency and coupling metrics
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Set
 from pathlib import Path
 import ast
+import sys
 
+from python_ext_stats.metrics.module_index import module_index
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
 
 
@@ -25,8 +27,8 @@ class DependencyAndCouplingMetrics(ProjectMetrics):
         result_metrics = {}
 
         result_metrics["Number of Libraries"] = cls.count_number_of_libs(parsed_py_files)
-        result_metrics["Number of Extensions in the Project"] = \
-            cls.get_all_file_extensions(all_files)
+        # The repository scan only collects regular files, so they are not checked again
+        result_metrics["Number of Extensions in the Project"] = _file_extensions(all_files)
 
         return result_metrics
 
@@ -51,14 +53,17 @@ class DependencyAndCouplingMetrics(ProjectMetrics):
             int: The total number of unique libraries imported in the parsed files.
         """
         imported_libs = set()
+        add = imported_libs.add
+        intern = sys.intern
 
         for tree in parsed_py_files:
-            for node in ast.walk(tree):
+            for node in module_index(tree).imports:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
-                        imported_libs.add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    imported_libs.add(node.module)
+                        add(intern(alias.name))
+                elif node.module is not None:
+                    # `from . import x` has no module name and names no library
+                    add(intern(node.module))
 
         return len(imported_libs)
 
@@ -66,13 +71,27 @@ class DependencyAndCouplingMetrics(ProjectMetrics):
     def get_all_file_extensions(all_files: List) -> set:
         """
         Retrieves all unique file extensions from the list of files.
+        Directories in the list are skipped.
 
         Returns:
             set: A set of unique file extensions from the list of files.
         """
-        extensions = set()
+        return _file_extensions(file for file in all_files if file.is_file())
 
-        for file in all_files:
-            if file.is_file() and file.suffix:
-                extensions.add(file.suffix)
-        return extensions
+
+def _file_extensions(files: Iterable) -> Set[str]:
+    """
+    Collects unique extensions of files known to be regular files.
+
+    Returns:
+        Set[str]: unique file extensions
+    """
+    extensions = set()
+
+    for file in files:
+        name = file.name
+        dot = name.rfind('.')
+        # Same rule as Path.suffix: no leading-dot names, no trailing dot
+        if 0 < dot < len(name) - 1:
+            extensions.add(name[dot:])
+    return extensions
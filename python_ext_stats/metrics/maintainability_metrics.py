@@ -2,11 +2,16 @@
 Module that provides maintainability metrics
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Callable, Dict, Any, List, Set
 from pathlib import Path
 import ast
+import sys
 
+from python_ext_stats.metrics.ast_names import docstring_text, dotted_name
 from python_ext_stats.metrics.project_metrics import ProjectMetrics
+from python_ext_stats.metrics.statement_walk import walk_statements
 
 
 class MaintainabilityMetrics(ProjectMetrics):
@@ -23,15 +28,14 @@ class MaintainabilityMetrics(ProjectMetrics):
             Dict: dict of calculated dependency and coupling metrics
         """
         result_metrics = {}
+        counters = _collect(parsed_py_files)
 
         result_metrics["Number of Functions or Methods Without Docstrings"] = \
-            cls.count_number_of_functions_or_methods_without_docstrings(parsed_py_files)
+            counters.without_docstrings
         result_metrics["Number of Functions or Methods Without Typing"] = \
-            cls.count_number_of_functions_or_methods_without_typing(parsed_py_files)
-        result_metrics["Number of Context Managers"] = \
-            cls.count_number_of_context_managers(parsed_py_files)
-        result_metrics["Number of Handled Exceptions"] = \
-            cls.count_number_of_handled_exceptions(parsed_py_files)
+            counters.without_typing
+        result_metrics["Number of Context Managers"] = counters.context_managers
+        result_metrics["Number of Handled Exceptions"] = len(counters.handled_exceptions)
 
         return result_metrics
 
@@ -59,14 +63,7 @@ class MaintainabilityMetrics(ProjectMetrics):
         Returns: 
             int: Number of Functions or Methods Without Docstrings
         """
-        counter = 0
-
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if not ast.get_docstring(node):
-                        counter += 1
-        return counter
+        return _collect(parsed_py_files).without_docstrings
 
     @staticmethod
     def count_number_of_functions_or_methods_without_typing(parsed_py_files: List) -> int:
@@ -76,34 +73,7 @@ class MaintainabilityMetrics(ProjectMetrics):
         Returns:
             int: Number of Functions or Methods Without Typing
         """
-        count = 0
-
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, ast.FunctionDef):
-                    has_typing = True
-
-                    args = node.args
-                    all_args = (
-                        args.posonlyargs
-                        + args.args
-                        + ([] if args.vararg is None else [args.vararg])  # *args
-                        + args.kwonlyargs
-                        + ([] if args.kwarg is None else [args.kwarg])     # **kwargs
-                    )
-
-                    for arg in all_args:
-                        if arg.annotation is None:
-                            has_typing = False
-                            break
-
-                    if node.returns is None:
-                        has_typing = False
-
-                    if not has_typing:
-                        count += 1
-
-        return count
+        return _collect(parsed_py_files).without_typing
 
     @staticmethod
     def count_number_of_context_managers(parsed_py_files: List) -> int:
@@ -114,14 +84,7 @@ class MaintainabilityMetrics(ProjectMetrics):
             int: Context Managers number
         
         """
-        context_manager_count = 0
-
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, ast.With):
-                    context_manager_count += len(node.items)
-
-        return context_manager_count
+        return _collect(parsed_py_files).context_managers
 
     @staticmethod
     def count_number_of_handled_exceptions(parsed_py_files: List) -> int:
@@ -131,20 +94,138 @@ class MaintainabilityMetrics(ProjectMetrics):
         Returns:
             int: Number of handled exceptions
         """
-        def run_temp_try_handlers(node):
-            for handler in node.handlers:
-                if handler.type:
-                    if isinstance(handler.type, ast.Tuple):
-                        for exc in handler.type.elts:
-                            handled_exceptions.add(ast.unparse(exc).strip())
-                    else:
-                        handled_exceptions.add(ast.unparse(handler.type).strip())
-
-        handled_exceptions = set()
-
-        for tree in parsed_py_files:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Try):
-                    run_temp_try_handlers(node)
-
-        return len(handled_exceptions)
+        return len(_collect(parsed_py_files).handled_exceptions)
+
+
+@dataclass
+class _MaintainabilityCounters:
+    """
+    Counters of all maintainability metrics
+    """
+    without_docstrings: int = 0
+    without_typing: int = 0
+    context_managers: int = 0
+    handled_exceptions: Set[str] = field(default_factory=set)
+
+    def add(self, other: "_MaintainabilityCounters") -> None:
+        """
+        Adds counters collected for another module
+        """
+        self.without_docstrings += other.without_docstrings
+        self.without_typing += other.without_typing
+        self.context_managers += other.context_managers
+        self.handled_exceptions |= other.handled_exceptions
+
+
+def _on_function(node: ast.FunctionDef, counters: _MaintainabilityCounters) -> None:
+    """Counts a function without full typing, then checks its docstring."""
+    if not _is_fully_typed(node):
+        counters.without_typing += 1
+
+    _on_async_function(node, counters)
+
+
+def _is_fully_typed(node: ast.FunctionDef) -> bool:
+    """
+    Checks that a function annotates its return value and every argument,
+    stopping at the first missing annotation.
+
+    Returns:
+        bool: True if nothing is left unannotated
+    """
+    if node.returns is None:
+        return False
+
+    args = node.args
+    for arg in (args.vararg, args.kwarg):  # *args, **kwargs
+        if arg is not None and arg.annotation is None:
+            return False
+
+    return all(arg.annotation is not None
+               for arg in chain(args.posonlyargs, args.args, args.kwonlyargs))
+
+
+def _on_async_function(node: ast.AsyncFunctionDef, counters: _MaintainabilityCounters) -> None:
+    """Counts a function of any kind without a docstring."""
+    if not _has_docstring(node):
+        counters.without_docstrings += 1
+
+
+def _has_docstring(node: ast.AsyncFunctionDef) -> bool:
+    """
+    Checks that a function starts with a docstring which ast.get_docstring
+    would not clean up to an empty string, without cleaning up the text.
+
+    Returns:
+        bool: True if the function is documented
+    """
+    docstring = docstring_text(node)
+    if docstring is None:
+        return False
+
+    # Cleaning strips whitespace of the first line, but of the others it only drops empty ones
+    first_line, _, other_lines = docstring.partition("\n")
+    return (first_line != "" and not first_line.isspace()) or other_lines.strip("\n") != ""
+
+
+def _on_with(node: ast.With, counters: _MaintainabilityCounters) -> None:
+    """Counts context managers of a with statement."""
+    counters.context_managers += len(node.items)
+
+
+def _exception_name(node: ast.expr) -> str:
+    """
+    Gets the source text of a handled exception. Plain and dotted names are read
+    from the nodes directly, anything else is unparsed. Like names, the text
+    is interned, since the same handlers recur across a project.
+
+    Returns:
+        str: exception as written in the handler
+    """
+    name = dotted_name(node)
+    return name if name is not None else sys.intern(ast.unparse(node).strip())
+
+
+def _on_try(node: ast.Try, counters: _MaintainabilityCounters) -> None:
+    """Collects names of exceptions handled by a try statement."""
+    for handler in node.handlers:
+        if handler.type:
+            if isinstance(handler.type, ast.Tuple):
+                for exc in handler.type.elts:
+                    counters.handled_exceptions.add(_exception_name(exc))
+            else:
+                counters.handled_exceptions.add(_exception_name(handler.type))
+
+
+_HANDLERS: Dict[type, Callable[..., None]] = {
+    ast.FunctionDef: _on_function,
+    ast.AsyncFunctionDef: _on_async_function,
+    ast.With: _on_with,
+    ast.Try: _on_try,
+}
+
+
+def _count_module(tree: ast.Module) -> _MaintainabilityCounters:
+    """
+    Collects maintainability counters of a single module in one traversal
+    of its statements.
+
+    Returns:
+        _MaintainabilityCounters: the module's counters
+    """
+    counters = _MaintainabilityCounters()
+    walk_statements(tree, _HANDLERS, counters)
+    return counters
+
+
+def _collect(parsed_py_files: List) -> _MaintainabilityCounters:
+    """
+    Collects maintainability counters of all modules.
+
+    Returns:
+        _MaintainabilityCounters: the summed counters
+    """
+    counters = _MaintainabilityCounters()
+    for module in parsed_py_files:
+        counters.add(_count_module(module))
+    return counters
@@ -0,0 +1,174 @@
+"""
+This module provides a per-module index of AST nodes shared between metrics
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
+import ast
+
+
+_INDEX_ATTR = "_ext_stats_index"
+
+
+@dataclass
+class ModuleIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    Nodes of a single parsed module, collected in one traversal
+    """
+    class_defs: List[ast.ClassDef] = field(default_factory=list)
+    func_defs: List[ast.FunctionDef] = field(default_factory=list)
+    all_func_defs: List[Union[ast.FunctionDef, ast.AsyncFunctionDef]] = \
+        field(default_factory=list)
+    imports: List[Union[ast.Import, ast.ImportFrom]] = field(default_factory=list)
+    calls_by_class: Dict[ast.ClassDef, List[ast.Call]] = field(default_factory=dict)
+    methods_by_class: Dict[ast.ClassDef, List[ast.FunctionDef]] = field(default_factory=dict)
+    class_names: FrozenSet[str] = frozenset()
+    classes_by_name: Dict[str, List[ast.ClassDef]] = field(default_factory=dict)
+    passes: int = 0
+
+
+def module_index(module: ast.Module) -> ModuleIndex:
+    """
+    Provides the index of a parsed module, building it on first access.
+
+    The index is stored on the module itself, so it lives exactly as long
+    as the tree.
+
+    Args:
+        module (ast.Module): Parsed module.
+
+    Returns:
+        ModuleIndex: index of the module's nodes
+    """
+    index = getattr(module, _INDEX_ATTR, None)
+    if index is None:
+        index = _build_index(module)
+        setattr(module, _INDEX_ATTR, index)
+    return index
+
+
+def _build_index(module: ast.Module) -> ModuleIndex:
+    """
+    Walks a module once (breadth-first, like ast.walk) and fills its index.
+
+    Every call found in a class body is attributed to the innermost class
+    containing it, so calls of a nested class do not count for the outer one.
+
+    Returns:
+        ModuleIndex: index of the module's nodes
+    """
+    index = ModuleIndex()
+    queue: Deque[Tuple[ast.AST, Optional[ast.ClassDef]]] = deque([(module, None)])
+
+    while queue:
+        node, owner = queue.popleft()
+
+        handler = _HANDLERS.get(type(node))
+        body_owner = handler(index, node, owner) if handler else owner
+
+        if body_owner is owner or body_owner is None:
+            queue.extend((child, owner) for child in ast.iter_child_nodes(node))
+        else:
+            body_ids = {id(stmt) for stmt in body_owner.body}
+            queue.extend(
+                (child, body_owner if id(child) in body_ids else owner)
+                for child in ast.iter_child_nodes(node)
+            )
+
+    for class_def in index.class_defs:
+        index.classes_by_name.setdefault(class_def.name, []).append(class_def)
+    index.class_names = frozenset(index.classes_by_name)
+    return index
+
+
+def _on_class(index: ModuleIndex, node: ast.ClassDef,
+              owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Indexes a class. Its body statements are owned by the class itself.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the class body
+    """
+    del owner
+    index.class_defs.append(node)
+    index.calls_by_class[node] = []
+    index.methods_by_class[node] = [
+        stmt for stmt in node.body if isinstance(stmt, ast.FunctionDef)
+    ]
+    return node
+
+
+def _on_function(index: ModuleIndex, node: ast.FunctionDef,
+                 owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Indexes a function or a method.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the function body
+    """
+    index.func_defs.append(node)
+    index.all_func_defs.append(node)
+    return owner
+
+
+def _on_async_function(index: ModuleIndex, node: ast.AsyncFunctionDef,
+                       owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Indexes a coroutine function or method.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the function body
+    """
+    index.all_func_defs.append(node)
+    return owner
+
+
+def _on_import(index: ModuleIndex, node: Union[ast.Import, ast.ImportFrom],
+               owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Indexes an import statement.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the import's children
+    """
+    index.imports.append(node)
+    return owner
+
+
+def _on_call(index: ModuleIndex, node: ast.Call,
+             owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Attributes a call to the class it is made in.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the call's children
+    """
+    if owner is not None:
+        index.calls_by_class[owner].append(node)
+    return owner
+
+
+def _on_pass(index: ModuleIndex, node: ast.Pass,
+             owner: Optional[ast.ClassDef]) -> Optional[ast.ClassDef]:
+    """
+    Counts a pass statement.
+
+    Returns:
+        Optional[ast.ClassDef]: owner of the statement's children
+    """
+    del node
+    index.passes += 1
+    return owner
+
+
+# Dispatch on the exact node type (see ast_names) is a single dict lookup per node
+_HANDLERS: Dict[type, Callable[..., Optional[ast.ClassDef]]] = {
+    ast.ClassDef: _on_class,
+    ast.FunctionDef: _on_function,
+    ast.AsyncFunctionDef: _on_async_function,
+    ast.Call: _on_call,
+    ast.Import: _on_import,
+    ast.ImportFrom: _on_import,
+    ast.Pass: _on_pass,
+}
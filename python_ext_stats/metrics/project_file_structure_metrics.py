@@ -49,4 +49,14 @@ class ProjectFileStructureMetrics(ProjectMetrics):
         Returns:
             int: depth of the repo tree 
         """
-        return max((len(path.relative_to(repo_path).parts) for path in all_files), default=0)
+        root_parts = Path(repo_path).parts
+        root_len = len(root_parts)
+        depth = 0
+        # Comparing the leading parts checks each file lies below the repository
+        # like relative_to does, without building a relative path per file
+        for path in all_files:
+            parts = path.parts
+            if parts[:root_len] != root_parts:
+                raise ValueError(f"{str(path)!r} is not in the subpath of {str(repo_path)!r}")
+            depth = max(depth, len(parts) - root_len)
+        return depth
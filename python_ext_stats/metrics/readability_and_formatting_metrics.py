@@ -2,10 +2,15 @@
 This module provides readability and formatting metrics
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Set, Tuple
 import ast
 from collections import defaultdict
 
+from python_ext_stats.metrics.module_index import module_index
+from python_ext_stats.metrics.statement_walk import walk_statements
+
 
 class ReadabilityAndFormattingMetrics:
     """
@@ -20,12 +25,12 @@ class ReadabilityAndFormattingMetrics:
             Dict: dict of calculated readability and formatting metrics
         """
         result_metrics = {}
+        line_counters = _collect_lines(py_files)
 
-        result_metrics["Duplication Percentage"] = cls.calculate_duplication_percentage(py_files)
-        result_metrics["Maximum py Line Length"] =\
-               cls.calculate_maximum_line_length(py_files)
-        result_metrics["Lines of Code"] = cls.count_lines_of_code(py_files)
-        result_metrics["Average Line Length"] = cls.calculate_average_line_length(py_files)
+        result_metrics["Duplication Percentage"] = line_counters.duplication_percentage()
+        result_metrics["Maximum py Line Length"] = line_counters.max_length
+        result_metrics["Lines of Code"] = line_counters.nonempty_lines
+        result_metrics["Average Line Length"] = line_counters.average_length()
         result_metrics["Average Identifier Length"] = \
             cls.calculate_average_identifier_length(parsed_py_files)
         result_metrics["Number of pass keywords"] = \
@@ -58,28 +63,7 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             float: Duplication percentage (0-100)
         """
-
-        code_lines_count = defaultdict(int)
-        total_lines = 0
-        duplicated_lines = 0
-
-        for py_file_path in py_files:
-            with open(py_file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-
-                lines = [line.strip() for line in lines if line.strip()]
-                total_lines += len(lines)
-
-                for line in lines:
-                    code_lines_count[line] += 1
-
-                    if code_lines_count[line] > 1:
-                        duplicated_lines += 1
-
-        if total_lines == 0:
-            return 0.0
-
-        return (duplicated_lines / total_lines) * 100 * 2
+        return _collect_lines(py_files).duplication_percentage()
 
     @staticmethod
     def calculate_maximum_line_length(py_files: List) -> int:
@@ -89,17 +73,7 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             int: max length
         """
-
-        max_length = -1
-
-        for py_file_path in py_files:
-            with open(py_file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-
-                for line in lines:
-                    max_length = max(max_length, len(line))
-
-        return max_length
+        return _collect_lines(py_files).max_length
 
     @staticmethod
     def count_lines_of_code(py_files: List) -> int:
@@ -109,16 +83,7 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             int: max length
         """
-
-        lines_num = 0
-
-        for py_file_path in py_files:
-            with open(py_file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-                lines = [line for line in lines if line.strip()]
-                lines_num += len(lines)
-
-        return lines_num
+        return _collect_lines(py_files).nonempty_lines
 
     @staticmethod
     def calculate_average_line_length(py_files: List) -> float:
@@ -127,17 +92,7 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             float: average length
         """
-
-        sum_len = 0
-        lines_num = 0
-
-        for py_file_path in py_files:
-            with open(py_file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-                sum_len += sum(len(line) for line in lines if line.strip())
-                lines_num += len(lines)
-
-        return sum_len / lines_num if lines_num else 0.0
+        return _collect_lines(py_files).average_length()
 
     @staticmethod
     def calculate_average_identifier_length(parsed_py_files: list) -> dict:
@@ -147,57 +102,17 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             Dict: a dictionary with the average lengths for 'class', 'method', and 'field'.
         """
-        def behave_func(body_node, current_instance_fields, current_methods):
-            method_name = body_node.name
-            current_methods.add(method_name)
-
-            args = body_node.args.args
-            self_arg_name = args[0].arg if args else None
-
-            if self_arg_name:
-                for sub_node in ast.walk(body_node):
-                    if isinstance(sub_node, ast.Assign):
-                        for target in sub_node.targets:
-                            if isinstance(target, ast.Attribute)\
-                                and (isinstance(target.value, ast.Name) and
-                                    (target.value.id == self_arg_name)):
-                                current_instance_fields.add(target.attr)
-
-        def behave_assign(body_node, current_class_fields):
-            for target in body_node.targets:
-                if isinstance(target, ast.Name):
-                    current_class_fields.add(target.id)
-
-        class_names = []
-        method_names = []
-        field_names = []
-
+        totals = [0] * 6
         for parsed in parsed_py_files:
-            for node in ast.walk(parsed):
-                if isinstance(node, ast.ClassDef):
-                    class_names.append(node.name)
-                    current_methods = set()
-                    current_class_fields = set()
-                    current_instance_fields = set()
-
-                    for body_node in node.body:
-                        if isinstance(body_node, ast.FunctionDef):
-                            behave_func(body_node, current_instance_fields, current_methods)
+            module_lengths = _identifier_lengths_for_module(parsed)
+            totals = [total + length for total, length in zip(totals, module_lengths)]
 
-                        elif isinstance(body_node, ast.Assign):
-                            behave_assign(body_node, current_class_fields)
-
-                    method_names.extend(list(current_methods))
-                    all_fields = current_class_fields.union(current_instance_fields)
-                    field_names.extend(list(all_fields))
+        class_len, class_num, method_len, method_num, field_len, field_num = totals
 
         return {
-            'class': sum(len(name) for name in class_names) / len(class_names) \
-                if class_names else 0.0,
-            'method': sum(len(m) for m in method_names) / len(method_names) \
-                if method_names else 0.0,
-            'field': sum(len(f) for f in field_names) / len(field_names) \
-                if field_names else 0.0
+            'class': class_len / class_num if class_num else 0.0,
+            'method': method_len / method_num if method_num else 0.0,
+            'field': field_len / field_num if field_num else 0.0
         }
 
     @staticmethod
@@ -207,10 +122,149 @@ class ReadabilityAndFormattingMetrics:
         Returns:
             int: number of keywords
         """
-        pass_count = 0
+        return sum(module_index(parsed_ast).passes for parsed_ast in parsed_py_files)
+
+
+def _identifier_lengths_for_module(parsed: ast.Module) -> Tuple[int, int, int, int, int, int]:
+    """
+    Sums lengths of class, method and field names of a single module.
+
+    Returns:
+        Tuple[int, int, int, int, int, int]: total length and number of names
+                                             for classes, methods and fields
+    """
+    def behave_func(body_node, current_instance_fields, current_methods):
+        method_name = body_node.name
+        current_methods.add(method_name)
+
+        args = body_node.args.args
+        self_arg_name = args[0].arg if args else None
+
+        if self_arg_name:
+            walk_statements(body_node, _INSTANCE_FIELD_HANDLERS,
+                            _InstanceFields(self_arg_name, current_instance_fields))
+
+    def behave_assign(body_node, current_class_fields):
+        for target in body_node.targets:
+            if isinstance(target, ast.Name):
+                current_class_fields.add(target.id)
+
+    class_names = []
+    method_names = []
+    field_names = []
+
+    for node in module_index(parsed).class_defs:
+        class_names.append(node.name)
+        current_methods = set()
+        current_class_fields = set()
+        current_instance_fields = set()
+
+        for body_node in node.body:
+            if isinstance(body_node, ast.FunctionDef):
+                behave_func(body_node, current_instance_fields, current_methods)
+
+            elif isinstance(body_node, ast.Assign):
+                behave_assign(body_node, current_class_fields)
+
+        method_names.extend(list(current_methods))
+        all_fields = current_class_fields.union(current_instance_fields)
+        field_names.extend(list(all_fields))
+
+    return (sum(map(len, class_names)), len(class_names),
+            sum(map(len, method_names)), len(method_names),
+            sum(map(len, field_names)), len(field_names))
+
+
+@dataclass
+class _LineCounters:
+    """
+    Counters of all line-based readability metrics
+    """
+    lines: int = 0
+    nonempty_lines: int = 0
+    nonempty_length: int = 0
+    duplicated_lines: int = 0
+    max_length: int = -1
+
+    def duplication_percentage(self) -> float:
+        """
+        Calculates the percentage of duplicated nonempty lines.
+
+        Returns:
+            float: Duplication percentage (0-100)
+        """
+        if self.nonempty_lines == 0:
+            return 0.0
+        return (self.duplicated_lines / self.nonempty_lines) * 100 * 2
+
+    def average_length(self) -> float:
+        """
+        Calculates the average line length, blank lines counted as empty.
+
+        Returns:
+            float: average length of nonempty lines over all lines
+        """
+        return self.nonempty_length / self.lines if self.lines else 0.0
+
+
+def _read_lines(py_file_path: Path) -> List[str]:
+    """
+    Reads lines of a py file.
+
+    Returns:
+        List[str]: lines with their line endings
+    """
+    with open(py_file_path, 'r', encoding='utf-8') as file:
+        return file.readlines()
+
+
+def _collect_lines(py_files: List) -> _LineCounters:
+    """
+    Collects all line-based counters reading every file once.
+    Empty lines are ignored for duplication.
+
+    Returns:
+        _LineCounters: the counters
+    """
+    counters = _LineCounters()
+    code_lines_count = defaultdict(int)
+
+    for lines in map(_read_lines, py_files):
+        counters.lines += len(lines)
+
+        for line in lines:
+            length = len(line)
+            counters.max_length = max(counters.max_length, length)
+
+            stripped = line.strip()
+            if stripped:
+                counters.nonempty_lines += 1
+                counters.nonempty_length += length
+                code_lines_count[stripped] += 1
+                if code_lines_count[stripped] > 1:
+                    counters.duplicated_lines += 1
+
+    return counters
+
+
+@dataclass
+class _InstanceFields:
+    """
+    Fields assigned through the first argument of a method
+    """
+    self_arg_name: str
+    fields: Set[str]
+
+
+def _on_assign(node: ast.Assign, instance_fields: _InstanceFields) -> None:
+    """Collects fields assigned as `self.<name> = ...`."""
+    for target in node.targets:
+        if isinstance(target, ast.Attribute)\
+            and (isinstance(target.value, ast.Name) and
+                (target.value.id == instance_fields.self_arg_name)):
+            instance_fields.fields.add(target.attr)
+
 
-        for parsed_ast in parsed_py_files:
-            for node in ast.walk(parsed_ast):
-                if isinstance(node, ast.Pass):
-                    pass_count += 1
-        return pass_count
+_INSTANCE_FIELD_HANDLERS: Dict[type, Callable[..., None]] = {
+    ast.Assign: _on_assign,
+}
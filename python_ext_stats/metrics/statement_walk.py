@@ -0,0 +1,59 @@
+"""
+This module provides a traversal of module statements dispatching on node type
+"""
+
+from typing import Any, Callable, Dict, FrozenSet
+import ast
+
+
+# Statements only ever contain other statements through these nodes,
+# so expressions are never descended into
+STATEMENT_NODES = (ast.stmt, ast.excepthandler) + \
+    ((ast.match_case,) if hasattr(ast, "match_case") else ())
+
+
+def _concrete_types(bases: tuple) -> FrozenSet[type]:
+    """
+    Collects the node classes the parser actually creates for the given bases.
+
+    Returns:
+        FrozenSet[type]: the bases and all their subclasses
+    """
+    types = set()
+    pending = list(bases)
+    while pending:
+        node_type = pending.pop()
+        types.add(node_type)
+        pending.extend(node_type.__subclasses__())
+    return frozenset(types)
+
+
+# Statements are matched by exact type, as explained in ast_names
+STATEMENT_TYPES = _concrete_types(STATEMENT_NODES)
+
+
+def walk_statements(tree: ast.AST, handlers: Dict[type, Callable[..., None]],
+                    counters: Any) -> None:
+    """
+    Walks all statements of a tree once and calls the handler registered for
+    the type of each statement with the node and counters.
+
+    Args:
+        tree (ast.AST): Tree to walk.
+        handlers (Dict[type, Callable[..., None]]): Handler for each counted statement type.
+        counters (Any): Object the handlers update.
+    """
+    statement_types = STATEMENT_TYPES
+    stack = [tree]
+    pop = stack.pop
+    append = stack.append
+    iter_child_nodes = ast.iter_child_nodes
+
+    while stack:
+        node = pop()
+        handler = handlers.get(type(node))
+        if handler is not None:
+            handler(node, counters)
+        for child in iter_child_nodes(node):
+            if type(child) in statement_types:
+                append(child)
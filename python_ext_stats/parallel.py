@@ -0,0 +1,133 @@
+"""
+This module provides helpers to spread independent per-file work across processes
+(or threads on free-threaded builds) and to overlap file I/O across threads.
+Workers are given paths rather than parsed trees: pickling a tree costs more
+than any metric computed from it, so tree-based metrics run in-process.
+"""
+
+import atexit
+import os
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from python_ext_stats import config
+
+
+_WORKER_POOL: Optional[Executor] = None
+
+
+def gil_disabled() -> bool:
+    """
+    Checks whether the interpreter is a free-threaded build running without the GIL.
+
+    Returns:
+        bool: True if threads can run python code in parallel
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return False
+    return not is_gil_enabled()  # pylint: disable=not-callable
+
+
+def get_worker_pool(workers: int) -> Executor:
+    """
+    Provides the pool shared by all metrics, starting it on first use,
+    so workers are spawned once per run instead of once per metric.
+
+    Without the GIL the pool runs threads, which take parsed modules as they are;
+    otherwise it runs processes, which receive pickled copies.
+
+    Args:
+        workers (int): Number of workers for a newly started pool.
+
+    Returns:
+        Executor: The shared pool.
+    """
+    global _WORKER_POOL  # pylint: disable=global-statement
+
+    if _WORKER_POOL is None:
+        if gil_disabled():
+            _WORKER_POOL = ThreadPoolExecutor(max_workers=workers)
+        else:
+            _WORKER_POOL = ProcessPoolExecutor(max_workers=workers)
+    return _WORKER_POOL
+
+
+def shutdown_worker_pool() -> None:
+    """
+    Stops the shared pool, if it was started.
+    """
+    global _WORKER_POOL  # pylint: disable=global-statement
+
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.shutdown()
+        _WORKER_POOL = None
+
+
+atexit.register(shutdown_worker_pool)
+
+
+def parallel_map(func: Callable, items: List) -> List[Any]:
+    """
+    Applies a function to every item, using the shared worker pool for large inputs.
+
+    Args:
+        func (Callable): Top-level (picklable) function to apply.
+        items (List): Independent items, e.g. file paths.
+
+    Returns:
+        List: Results in the same order as the items.
+    """
+    workers = os.cpu_count() or 1
+
+    if workers < 2 or len(items) < config.PARALLEL_MIN_ITEMS:
+        return [func(item) for item in items]
+
+    chunksize = max(1, len(items) // (4 * workers))
+    executor = get_worker_pool(workers)
+    return list(executor.map(func, items, chunksize=chunksize))
+
+
+def submit(func: Callable, items: List) -> Future:
+    """
+    Starts a function over a whole list of items in the shared worker pool, so the caller
+    can compute other metrics meanwhile. Small inputs are handled right away in this process.
+
+    Args:
+        func (Callable): Top-level (picklable) function taking the whole list.
+        items (List): Items for the function, e.g. file paths.
+
+    Returns:
+        Future: Future holding the result of the function.
+    """
+    workers = os.cpu_count() or 1
+
+    if workers < 2 or len(items) < config.PARALLEL_MIN_ITEMS:
+        future = Future()
+        try:
+            future.set_result(func(items))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            future.set_exception(error)
+        return future
+
+    return get_worker_pool(workers).submit(func, items)
+
+
+def threaded_map(func: Callable, items: List) -> List[Any]:
+    """
+    Applies an I/O-bound function to every item using a thread pool,
+    so that reads of many small files overlap.
+
+    Args:
+        func (Callable): Function to apply, e.g. reading a file.
+        items (List): Independent items, e.g. file paths.
+
+    Returns:
+        List: Results in the same order as the items.
+    """
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(config.IO_MAX_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
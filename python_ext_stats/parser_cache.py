@@ -0,0 +1,95 @@
+"""
+This module provides memoized reading and parsing of python files
+"""
+
+import ast
+import functools
+import hashlib
+import os
+import weakref
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from python_ext_stats.parallel import gil_disabled, parallel_map
+
+
+# Trees of file contents still in use, whichever path they were read from
+_TREES_BY_CONTENT: "weakref.WeakValueDictionary[bytes, ast.Module]" = \
+    weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_cached(path: str, mtime_ns: int, size: int) -> ast.Module:
+    """
+    Parses a python file straight from its bytes, without decoding it to a str first.
+    Results are memoized by path and file stats, so a changed file is parsed again
+    while an unchanged one is not. Files with identical content, like empty
+    `__init__.py` files, share a single tree.
+
+    Args:
+        path (str): Path to the file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        ast.Module: Parsed module.
+    """
+    # mtime_ns and size are only a part of the cache key
+    del mtime_ns, size
+    source = Path(path).read_bytes()
+    digest = hashlib.blake2b(source, digest_size=16).digest()
+
+    tree = _TREES_BY_CONTENT.get(digest)
+    if tree is None:
+        tree = ast.parse(source, filename=path)
+        _TREES_BY_CONTENT[digest] = tree
+    return tree
+
+
+def cache_key(path: Union[str, Path]) -> Tuple[str, int, int]:
+    """
+    Builds a cache key from a path and the file's current stats.
+
+    Returns:
+        Tuple[str, int, int]: path, modification time and size
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def parse_file(path: Union[str, Path]) -> ast.Module:
+    """
+    Parses a python file, reusing the tree of an unchanged file parsed before.
+
+    Args:
+        path (Union[str, Path]): Path to the file.
+
+    Returns:
+        ast.Module: Parsed module.
+
+    Raises:
+        SyntaxError: If the file is not valid python code.
+    """
+    return parse_cached(*cache_key(path))
+
+
+def parse_files(paths: List[Union[str, Path]]) -> List[ast.Module]:
+    """
+    Parses python files, spreading the work across threads on free-threaded builds.
+
+    With the GIL the files are parsed one by one: sending a tree back from a worker
+    process costs more than parsing it, and the trees would miss this process's cache.
+
+    Args:
+        paths (List[Union[str, Path]]): Paths to the files.
+
+    Returns:
+        List[ast.Module]: Parsed modules in the order of the paths.
+
+    Raises:
+        SyntaxError: If a file is not valid python code.
+    """
+    if gil_disabled():
+        return parallel_map(parse_file, paths)
+    return [parse_file(path) for path in paths]
@@ -113,3 +113,32 @@ class TestCBOMetric:
         """
         result = cbometric.count_coupling_between_objects([complex_case_module])
         assert result["Child"] == 2
+
+    def test_builtin_types_are_not_coupling(self, cbometric: CBOMetric):
+        """
+        Test that calls and bases of builtin types are not counted.
+        """
+        module = ast.parse("""
+class Holder(object):
+    def __init__(self):
+        self.items = tuple(set(frozenset()))
+        self.raw = bytes(bytearray())
+""")
+        result = cbometric.count_coupling_between_objects([module])
+        assert result["Holder"] == 0
+
+    def test_nested_class_calls_count_for_inner_class(self, cbometric: CBOMetric):
+        """
+        Test that calls inside a nested class are not counted for the outer class.
+        """
+        module = ast.parse("""
+class Helper:
+    pass
+
+class Outer:
+    class Inner:
+        helper = Helper()
+""")
+        result = cbometric.count_coupling_between_objects([module])
+        assert result["Outer"] == 0
+        assert result["Inner"] == 1
@@ -38,6 +38,31 @@ def multiple_files(tmp_path):
 
     return [file1, file2]
 
+@pytest.fixture
+def files_with_blank_lines(tmp_path):
+    """Fixture for files containing empty and whitespace-only lines."""
+    file1 = tmp_path / "file1.py"
+    file1.write_text("a = 1\n\n    \nb = 2\n")
+
+    file2 = tmp_path / "file2.py"
+    file2.write_text("\t\r\nx = 4\r\n\r\ny = 5")
+
+    return [file1, file2]
+
+@pytest.fixture
+def files_with_other_line_endings(tmp_path):
+    """Fixture for files with CR and CRLF line endings and a unicode blank line."""
+    file1 = tmp_path / "cr.py"
+    file1.write_bytes(b"x = 1\ry = 2\r\rz = 3\r")
+
+    file2 = tmp_path / "crlf.py"
+    file2.write_bytes(b"x = 1\r\ny = 2\r\n\r\n")
+
+    file3 = tmp_path / "nbsp.py"
+    file3.write_bytes('s = """\n\u00a0\n"""\n'.encode("utf-8"))
+
+    return [file1, file2, file3]
+
 @pytest.fixture
 def methods_code():
     """Fixture for code containing multiple methods."""
@@ -51,6 +76,17 @@ def method2():
     x = 4
 """
 
+@pytest.fixture
+def multiline_method_code():
+    """Fixture for code containing a method whose last statement spans several lines."""
+    return """
+def method1():
+    return call(
+        1,
+        2,
+    )
+"""
+
 @pytest.fixture
 def classes_code_no_methods():
     """Fixture for code containing classes with no methods."""
@@ -92,6 +128,17 @@ def func1(a, b): pass
 def func2(c, d, e, f): pass
 """
 
+@pytest.fixture
+def nested_functions_code():
+    """Fixture for code containing a closure, a lambda and a comprehension."""
+    return """
+def outer(a, b):
+    def inner(c):
+        return c
+    key = lambda d: d
+    return [inner(x) for x in (a, b)], key
+"""
+
 class TestAverageBasedMetrics:
     """
     Tests for average-based metrics
@@ -114,6 +161,25 @@ class TestAverageBasedMetrics:
                 (multiple_files)
         assert result == (3 + 5) / 2
 
+    def test_average_lines_per_file_skips_blank_lines(self, metrics, files_with_blank_lines):
+        """
+        Test that empty and whitespace-only lines are not counted.
+        """
+        result = metrics\
+            .count_average_number_of_lines_per_file\
+                (files_with_blank_lines)
+        assert result == (2 + 2) / 2
+
+    def test_average_lines_per_file_with_other_line_endings(self, metrics,
+                                                            files_with_other_line_endings):
+        """
+        Test that CR and CRLF line endings split lines and unicode whitespace is blank.
+        """
+        result = metrics\
+            .count_average_number_of_lines_per_file\
+                (files_with_other_line_endings)
+        assert result == (3 + 2 + 2) / 3
+
     def test_average_lines_per_method_no_methods(self, metrics):
         """
         Test that the average number of lines per method is 0 when no methods are provided.
@@ -133,6 +199,16 @@ class TestAverageBasedMetrics:
             .count_average_number_of_lines_per_method(parsed_files)
         assert result == (3 + 1) / 2
 
+    def test_average_lines_per_method_multiline_statement(self, metrics, multiline_method_code):
+        """
+        Test that the closing line of a multi-line statement is counted.
+        """
+        tree = ast.parse(multiline_method_code)
+
+        result = metrics\
+            .count_average_number_of_lines_per_method([tree])
+        assert result == 4
+
     def test_average_methods_per_class_no_classes(self, metrics):
         """
         Test that the average number of methods per class is 0 when no classes are provided.
@@ -194,3 +270,13 @@ class TestAverageBasedMetrics:
         result = metrics\
         .count_average_number_of_params_per_method_or_function(parsed_files)
         assert result == (2 + 4) / 2
+
+    def test_average_params_counts_nested_functions(self, metrics, nested_functions_code):
+        """
+        Test that nested functions are counted, while lambdas and comprehensions are not.
+        """
+        tree = ast.parse(nested_functions_code)
+
+        result = metrics\
+        .count_average_number_of_params_per_method_or_function([tree])
+        assert result == (2 + 1) / 2
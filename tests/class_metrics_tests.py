@@ -95,6 +95,27 @@ class Beta(Alpha):
     return ast.parse(code)
 
 
+@pytest.fixture
+def deep_inheritance_class_module() -> ast.Module:
+    """AST module with an inheritance chain deeper than the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    code = "class C0:\n    pass\n" + "".join(
+        f"class C{i}(C{i - 1}):\n    pass\n" for i in range(1, depth)
+    )
+    return ast.parse(code)
+
+@pytest.fixture
+def cyclic_inheritance_class_module() -> ast.Module:
+    """AST module with mutually inheriting classes."""
+    code = """
+class A(B):
+    pass
+
+class B(A):
+    pass
+"""
+    return ast.parse(code)
+
 class TestClassMetrics:
     """Tests suite for ClassMetrics functionality."""
 
@@ -194,3 +215,39 @@ class TestClassMetrics:
         result = classmetrics.\
             calculate_depth_of_inheritance_tree([sample_inheritance_class_module])
         assert result == 4
+
+    def test_depth_of_inheritance_tree_deep_chain(self, classmetrics: ClassMetrics,\
+                                                  deep_inheritance_class_module: ast.Module):
+        """
+        Test DIT calculation for a chain deeper than the recursion limit.
+        Expected DIT: length of the chain
+        """
+        result = classmetrics.\
+            calculate_depth_of_inheritance_tree([deep_inheritance_class_module])
+        assert result == sys.getrecursionlimit() + 100
+
+    def test_depth_of_inheritance_tree_cycle(self, classmetrics: ClassMetrics,\
+                                             cyclic_inheritance_class_module: ast.Module):
+        """
+        Test DIT calculation terminates for cyclic inheritance.
+        Expected DIT: 2
+        """
+        result = classmetrics.\
+            calculate_depth_of_inheritance_tree([cyclic_inheritance_class_module])
+        assert result == 2
+
+    def test_value_matches_separate_metrics(self, classmetrics: ClassMetrics,\
+                                            simple_class_module: ast.Module,\
+                                            simple__two_class_module: ast.Module):
+        """
+        Test that value() collects the same results as the separate metric methods.
+        """
+        modules = [simple_class_module, simple__two_class_module]
+
+        assert classmetrics.value(modules) == {
+            "Method Hiding Factor": classmetrics.calculate_method_hiding_factor(modules),
+            "Attribute Hiding Factor": classmetrics.calculate_attribute_hiding_factor(modules),
+            "Method Inheritance Factor": classmetrics.calculate_method_inheritance_factor(modules),
+            "Polymorphism Factor": classmetrics.calculate_method_polymorphism_factor(modules),
+            "Depth Of Inheritance Tree": classmetrics.calculate_depth_of_inheritance_tree(modules),
+        }
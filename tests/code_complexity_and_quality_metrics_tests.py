@@ -4,12 +4,24 @@ This module provides code complexity and quality metrics tests
 
 import ast
 import os
+import sys
 from pathlib import Path
 from typing import List
 import pytest
+import vulture
+from radon.visitors import HalsteadVisitor
 
+from python_ext_stats import config, parallel
 from python_ext_stats.metrics.code_complexity_and_quality_metrics\
-      import CodeComplexityAndQualityMetrics
+      import CodeComplexityAndQualityMetrics, cyclomatic_complexity
+
+
+@pytest.fixture
+def worker_pool_shutdown():
+    """Fixture shutting down the worker pool a test may have started."""
+    parallel.shutdown_worker_pool()
+    yield
+    parallel.shutdown_worker_pool()
 
 
 @pytest.fixture
@@ -314,6 +326,51 @@ class TestCodeComplexityAndQualityMetrics:
                 f"Expected {expected['attributes']}, got {actual['attributes']}"
             )
 
+    def test_lcom_with_many_attributes(self, metrics: CodeComplexityAndQualityMetrics) -> None:
+        """
+        Tests LCOM for a class whose methods use more attributes than fit in a machine word.
+        """
+        methods = "\n".join(
+            f"    def method_{i}(self):\n        return self.attr_{i}, self.shared_{i // 2}"
+            for i in range(100)
+        )
+        parsed_file = ast.parse(f"class Wide:\n{methods}\n")
+
+        lcom_data = metrics.calculate_lcom([parsed_file])
+
+        # 4950 pairs of methods, 50 of which share an attribute
+        assert lcom_data["Wide"]["lcom"] == (4950 - 50) - 50
+        assert lcom_data["Wide"]["methods"] == 100
+
+    def test_cyclomatic_complexity_of_deeply_nested_function(self) -> None:
+        """
+        Tests that nesting deeper than the recursion limit is handled.
+        """
+        depth = sys.getrecursionlimit() + 100
+        body = [ast.Pass()]
+        for _ in range(depth):
+            body = [ast.If(test=ast.Name(id="flag", ctx=ast.Load()), body=body, orelse=[])]
+        function = ast.FunctionDef(name="nested", args=ast.arguments(
+            posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=body, decorator_list=[])
+
+        assert cyclomatic_complexity(function) == depth + 1
+
+    @pytest.mark.usefixtures("worker_pool_shutdown")
+    def test_parallel_per_file_metrics_match_serial(self,
+                                                    metrics: CodeComplexityAndQualityMetrics,
+                                                    temp_py_files: List[str],
+                                                    monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that files processed by a process pool give the same Halstead values.
+        """
+        serial_halstead = metrics.calculate_halstead_complexity(temp_py_files)
+
+        monkeypatch.setattr(config, "PARALLEL_MIN_ITEMS", 1)
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+
+        assert metrics.calculate_halstead_complexity(temp_py_files) == serial_halstead
+
     def test_dead_code(self, metrics: CodeComplexityAndQualityMetrics,\
                         temp_py_files: List[str]) -> None:
         """
@@ -328,3 +385,62 @@ class TestCodeComplexityAndQualityMetrics:
         assert  any("used_function" in unused_item.name for unused_item in dead_code), (
             "'used_function' should be detected as dead code."
         )
+
+    def test_dead_code_is_reused_for_unchanged_files(self,
+                                                    metrics: CodeComplexityAndQualityMetrics,
+                                                    temp_py_files: List[str],
+                                                    monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that vulture scans an unchanged set of files only once.
+        """
+        scavenge_calls = []
+        original_scavenge = vulture.Vulture.scavenge
+
+        def counting_scavenge(self, paths, exclude=None):
+            scavenge_calls.append(paths)
+            return original_scavenge(self, paths, exclude)
+
+        monkeypatch.setattr(vulture.Vulture, "scavenge", counting_scavenge)
+
+        first = metrics.find_dead_code(temp_py_files)
+        second = metrics.find_dead_code(temp_py_files)
+
+        assert [item.name for item in first] == [item.name for item in second]
+        assert len(scavenge_calls) == 1
+
+    def test_halstead_of_trivial_modules(self, metrics: CodeComplexityAndQualityMetrics,
+                                         tmp_path: Path) -> None:
+        """
+        Tests that empty and import-only modules get zero Halstead metrics.
+        """
+        empty_file = tmp_path / "__init__.py"
+        empty_file.write_text("", encoding="utf-8")
+        imports_file = tmp_path / "api.py"
+        imports_file.write_text('"""Public API."""\nimport os\nfrom sys import path\n',
+                                encoding="utf-8")
+
+        result = metrics.calculate_halstead_complexity([empty_file, imports_file])
+
+        zeros = {"n1": 0, "n2": 0, "N1": 0, "N2": 0}
+        assert result == {empty_file: zeros, imports_file: zeros}
+
+    def test_halstead_skips_too_deeply_nested_files(self, metrics: CodeComplexityAndQualityMetrics,
+                                                    tmp_path: Path, monkeypatch, caplog) -> None:
+        """
+        Tests that a file exceeding recursion depth is left out and logged once.
+        """
+        deep_file = tmp_path / "deep.py"
+        deep_file.write_text("x = 1 + 2\n", encoding="utf-8")
+        flat_file = tmp_path / "flat.py"
+        flat_file.write_text("import os\n", encoding="utf-8")
+
+        def too_deep(*_args, **_kwargs):
+            raise RecursionError
+
+        monkeypatch.setattr(HalsteadVisitor, "from_ast", too_deep)
+
+        result = metrics.calculate_halstead_complexity([deep_file, flat_file])
+
+        assert list(result) == [flat_file]
+        assert len(caplog.records) == 1
+        assert str(deep_file) in caplog.records[0].getMessage()
@@ -153,10 +153,10 @@ class TestCodeStructureMetrics:
             ([tree]) == 0
 
     def test_count_static_methods(self, metrics, static_methods_code):
-        """Test counting static and class methods inside a class."""
+        """Test counting static methods inside a class, ignoring decorated module functions."""
         tree = parse_code(static_methods_code)
         assert metrics.count_number_of_static_methods_in_classes\
-            ([tree]) == 3
+            ([tree]) == 2
 
     def test_max_params_empty(self, metrics, empty_code):
         """Test that an empty code string has zero method parameters."""
@@ -211,3 +211,26 @@ class A:
         """
         tree = parse_code(constants_code)
         assert metrics.count_number_of_constants([tree]) == 3
+
+    def test_definitions_in_compound_statements_are_counted(self, metrics):
+        """
+        Test that classes, functions and constants nested in compound statements are found.
+        """
+        tree = parse_code("""
+try:
+    import fast_module
+except ImportError:
+    class Fallback:
+        LIMIT = 10
+
+        @staticmethod
+        def run(a, b, c):
+            return [lambda: a for _ in range(b)]
+else:
+    with open(__file__) as file:
+        DEBUG = False
+""")
+        assert metrics.count_number_of_classes([tree]) == 1
+        assert metrics.count_number_of_static_methods_in_classes([tree]) == 1
+        assert metrics.count_max_number_of_method_params([tree]) == 3
+        assert metrics.count_number_of_constants([tree]) == 2
@@ -2,6 +2,7 @@
 This module provides dependency and coupling metrics tests
 """
 
+import os
 import sys
 import ast
 from pathlib import Path
@@ -76,6 +77,14 @@ class TestDependencyAndCouplingMetrics:
             (parsed_files_with_imports)
         assert result == 4  # os, sys, collections, mymodule
 
+    def test_count_number_of_libs_ignores_bare_relative_imports(self, metrics):
+        """
+        Test that `from . import x` is not counted as a library.
+        """
+        tree = ast.parse("from . import sibling\nfrom .package import name\nimport os\n")
+        result = metrics.count_number_of_libs([tree])
+        assert result == 2  # package, os
+
     def test_get_all_file_extensions_empty(self, metrics):
         """
         Test that no extensions are returned when no files are provided.
@@ -92,3 +101,27 @@ class TestDependencyAndCouplingMetrics:
 
         # Ensure only valid extensions are included and the virtual environment file is ignored
         assert result == {'.py', '.csv', '.txt'}
+
+    def test_get_all_file_extensions_from_dir_entries(self, metrics, tmp_path):
+        """
+        Test that directory entries are accepted and suffix-less names
+        and directories are skipped.
+        """
+        for name in ("module.py", "archive.tar.gz", ".gitignore", "Makefile", "odd."):
+            (tmp_path / name).write_text("")
+        (tmp_path / "package.d").mkdir()
+
+        with os.scandir(tmp_path) as entries:
+            result = metrics.get_all_file_extensions(list(entries))
+
+        assert result == {'.py', '.gz'}
+
+    def test_value_takes_extensions_of_scanned_files_as_they_are(self, metrics, tmp_path):
+        """
+        Test that value() trusts the scanned files instead of checking each one again.
+        """
+        scanned_files = [tmp_path / "gone.py", tmp_path / "notes.txt"]
+
+        result = metrics.value([], [], scanned_files, tmp_path)
+
+        assert result["Number of Extensions in the Project"] == {'.py', '.txt'}
@@ -0,0 +1,121 @@
+"""
+This module provides on-disk cache tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import radon
+
+from python_ext_stats import config, disk_cache
+from python_ext_stats.metrics.code_complexity_and_quality_metrics import \
+    CodeComplexityAndQualityMetrics
+
+
+@pytest.fixture(name="cache_path")
+def cache_path_fixture(tmp_path: Path, monkeypatch) -> Path:
+    """
+    Enables the on-disk cache in a temporary directory.
+    """
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(config.DISK_CACHE_ENV, str(cache_path))
+    return cache_path
+
+
+def test_result_is_computed_once_per_content(tmp_path: Path, cache_path: Path):
+    """
+    Test that files with the same content share one stored result.
+    """
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"func": 1}
+
+    first, second = tmp_path / "a.py", tmp_path / "b.py"
+    first.write_text("def func():\n    pass\n", encoding="utf-8")
+    second.write_text("def func():\n    pass\n", encoding="utf-8")
+
+    assert disk_cache.cached("cc", first, compute) == {"func": 1}
+    assert disk_cache.cached("cc", second, compute) == {"func": 1}
+    assert len(calls) == 1
+    assert cache_path.is_dir()
+
+
+def test_disabled_cache_always_computes(tmp_path: Path, monkeypatch):
+    """
+    Test that nothing is stored without a cache directory.
+    """
+    monkeypatch.delenv(config.DISK_CACHE_ENV, raising=False)
+    py_file = tmp_path / "a.py"
+    py_file.write_text("x = 1\n", encoding="utf-8")
+    calls = []
+
+    disk_cache.cached("cc", py_file, lambda: calls.append(1))
+    disk_cache.cached("cc", py_file, lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_prune_keeps_newest_entries(tmp_path: Path, cache_path: Path):
+    """
+    Test that pruning removes entries beyond the limit.
+    """
+    for i in range(5):
+        py_file = tmp_path / f"{i}.py"
+        py_file.write_text(f"x = {i}\n", encoding="utf-8")
+        disk_cache.cached("cc", py_file, lambda: {})
+
+    disk_cache.prune(max_entries=2)
+
+    assert len([entry for entry in cache_path.rglob("*") if entry.is_file()]) == 2
+
+
+def test_prune_skips_cache_without_new_entries(tmp_path: Path, cache_path: Path, monkeypatch):
+    """
+    Test that the cache is only scanned after entries were written.
+    """
+    py_file = tmp_path / "module.py"
+    py_file.write_text("x = 1\n", encoding="utf-8")
+    disk_cache.cached("cc", py_file, lambda: {})
+    disk_cache.prune()
+
+    def fail_walk(*_):
+        raise AssertionError("cache scanned without new entries")
+
+    monkeypatch.setattr(disk_cache.os, "walk", fail_walk)
+    disk_cache.cached("cc", py_file, lambda: {})
+    disk_cache.prune()
+
+    assert len([entry for entry in cache_path.rglob("*") if entry.is_file()]) == 1
+
+def test_cached_metrics_match_computed(tmp_path: Path, cache_path: Path):
+    """
+    Test that metrics served from the cache equal freshly computed ones.
+    """
+    py_file = tmp_path / "module.py"
+    py_file.write_text("def func(a):\n    if a:\n        return a + 1\n", encoding="utf-8")
+    metrics = CodeComplexityAndQualityMetrics()
+
+    first = metrics.calculate_halstead_complexity([py_file])
+    second = metrics.calculate_halstead_complexity([py_file])
+
+    assert first == second
+    assert first[py_file]["N1"] > 0
+    assert any(cache_path.glob(f"halstead-radon{radon.__version__}-v*"))
+
+
+def test_changed_file_gets_a_new_entry(tmp_path: Path, cache_path: Path):
+    """
+    Test that an edited file is computed again and kept per python version.
+    """
+    py_file = tmp_path / "a.py"
+    py_file.write_text("x = 1\n", encoding="utf-8")
+    disk_cache.cached("cc", py_file, lambda: {"first": 1})
+
+    py_file.write_text("x = 22\n", encoding="utf-8")
+
+    assert disk_cache.cached("cc", py_file, lambda: {"second": 2}) == {"second": 2}
+    kind_dir, = (entry for entry in cache_path.iterdir() if entry.is_dir())
+    assert kind_dir.name.endswith(f"-py{sys.version_info[0]}{sys.version_info[1]}")
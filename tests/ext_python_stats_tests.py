@@ -0,0 +1,100 @@
+"""
+This module provides repository analysis tests
+"""
+
+from pathlib import Path
+import xml.etree.ElementTree as ET
+
+from python_ext_stats import disk_cache
+from python_ext_stats.ext_python_stats import ExtPythonStats
+
+
+def test_repository_files_skip_virtual_environments(tmp_path: Path):
+    """
+    Test that files inside virtual environment directories are not collected.
+    """
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package" / "module.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "package" / "data.csv").write_text("a,b\n", encoding="utf-8")
+    (tmp_path / "package" / "data.py").mkdir()
+    for venv_dir in ("venv", "package/.venv"):
+        (tmp_path / venv_dir).mkdir()
+        (tmp_path / venv_dir / "site.py").write_text("y = 2\n", encoding="utf-8")
+
+    stats = ExtPythonStats(str(tmp_path))
+
+    assert sorted(stats.all_files) == [tmp_path / "package" / "data.csv",
+                                       tmp_path / "package" / "module.py"]
+    assert stats.py_files == [tmp_path / "package" / "module.py"]
+    assert len(stats.parsed_py_files) == 1
+
+
+
+def test_repository_files_skip_symlinked_directories(tmp_path: Path):
+    """
+    Test that symlinked directories are not entered, as with os.walk.
+    """
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package" / "module.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "linked").symlink_to(tmp_path / "package", target_is_directory=True)
+
+    stats = ExtPythonStats(str(tmp_path))
+
+    assert stats.py_files == [tmp_path / "package" / "module.py"]
+
+def test_report_is_written_as_indented_xml(tmp_path: Path):
+    """
+    Test that the XML report holds every metric and is indented.
+    """
+    (tmp_path / "module.py").write_text("x = 1\n", encoding="utf-8")
+    report_file = tmp_path / "report.xml"
+    stats = ExtPythonStats(str(tmp_path))
+
+    stats.print(str(report_file), {"worktime": 1.23, "Number of Classes": 0, "LCOM": {}})
+
+    root = ET.parse(report_file).getroot()
+    assert root.find("worktime").text == "1.2 secs"
+    assert {metric.get("name"): metric.text for metric in root.iter("metric")} == \
+        {"Number of Classes": "0", "LCOM": "{}"}
+    text = report_file.read_text(encoding="utf-8")
+    assert "\n <metrics>\n  <metric" in text
+    assert text.endswith("</report>\n")
+
+
+def test_report_merges_all_metric_groups(tmp_path: Path):
+    """
+    Test that the report holds the metrics of every group after the worktime.
+    """
+    (tmp_path / "module.py").write_text("class Model:\n    pass\n", encoding="utf-8")
+
+    report = ExtPythonStats(str(tmp_path)).report()
+
+    assert next(iter(report)) == "worktime"
+    assert report["Number of Classes"] == 1
+    assert "Number of Libraries" in report
+    assert "LCOM" in report
+
+
+def test_report_prunes_disk_cache_once(tmp_path: Path, monkeypatch):
+    """
+    Test that the disk cache is pruned a single time, after all metric groups.
+    """
+    (tmp_path / "module.py").write_text("x = 1\n", encoding="utf-8")
+    prunes = []
+    monkeypatch.setattr(disk_cache, "prune", lambda: prunes.append(1))
+
+    ExtPythonStats(str(tmp_path)).report()
+
+    assert prunes == [1]
+
+def test_metrics_list_returns_lists_callers_may_change():
+    """
+    Test that metrics are listed as lists of names, fresh for every call.
+    """
+    metrics = ExtPythonStats.metrics_list()
+    assert all(isinstance(group, list) for group in metrics)
+    assert "Coupling between objects" in metrics[1]
+
+    metrics[1].append("Custom metric")
+
+    assert ExtPythonStats.metrics_list()[1] == ["Coupling between objects"]
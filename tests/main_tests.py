@@ -0,0 +1,31 @@
+"""
+This module provides command line interface tests
+"""
+
+from click.testing import CliRunner
+
+from python_ext_stats.main import main
+
+
+def test_missing_repository_path_is_rejected(tmp_path):
+    """
+    Test that a nonexistent repository path fails before any analysis.
+    """
+    result = CliRunner().invoke(main, ["--path", str(tmp_path / "missing")])
+
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+
+def test_unparsable_file_is_reported(tmp_path):
+    """
+    Test that a syntax error is reported with the file name and no traceback.
+    """
+    (tmp_path / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+    result = CliRunner().invoke(main, ["--path", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Unable to parse presented py file" in result.output
+    assert "broken.py" in result.output
+    assert "Traceback" not in result.output
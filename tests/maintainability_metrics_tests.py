@@ -198,3 +198,78 @@ class TestMaintainabilityMetrics:
         """
         assert maintainability_metrics.\
         count_number_of_handled_exceptions([try_except_ast]) == 1
+
+    def test_value_of_nested_code(self, maintainability_metrics):
+        """
+        test that all metrics are collected from nested statements in one pass
+        """
+        code = """
+class Reader:
+    def read(self, path):
+        try:
+            with open(path) as file, open(path) as copy:
+                async def inner() -> None:
+                    '''Docstring'''
+        except (OSError, ValueError):
+            pass
+        except OSError:
+            pass
+"""
+        result = maintainability_metrics.value([parse_code_to_ast(code), parse_code_to_ast(code)])
+
+        assert result == {
+            "Number of Functions or Methods Without Docstrings": 2,
+            "Number of Functions or Methods Without Typing": 2,
+            "Number of Context Managers": 4,
+            "Number of Handled Exceptions": 2,
+        }
+
+    def test_handled_exceptions_are_named_as_written(self, maintainability_metrics):
+        """
+        test that dotted and computed exception types are collected as written
+        """
+        code = """
+try:
+    pass
+except (os.error, errors.Timeout):
+    pass
+except errors.Timeout:
+    pass
+except get_errors()[0]:
+    pass
+"""
+        handled = maintainability_metrics.\
+        count_number_of_handled_exceptions([parse_code_to_ast(code)])
+
+        assert handled == 3
+
+    def test_blank_docstrings_are_counted_like_ast_get_docstring(self, maintainability_metrics):
+        """
+        test that only docstrings cleaned up to nothing leave a function undocumented,
+        while whitespace on later lines is kept by the clean up
+        """
+        code = '''
+def empty():
+    ""
+
+def blank():
+    """   """
+
+def blank_lines():
+    """
+
+    """
+
+def indented_blank_line():
+    """
+    \t"""
+
+def documented():
+    """Docstring"""
+
+def number():
+    1
+'''
+        assert maintainability_metrics.\
+    count_number_of_functions_or_methods_without_docstrings\
+            ([parse_code_to_ast(code)]) == 3
@@ -0,0 +1,96 @@
+"""
+This module provides module index tests
+"""
+
+import ast
+import pytest
+
+from python_ext_stats.metrics.module_index import module_index
+
+
+@pytest.fixture
+def nested_classes_module() -> ast.Module:
+    """AST module with a nested class and calls on both levels."""
+    code = """
+class Outer(Base):
+    def method(self):
+        helper()
+
+    class Inner:
+        value = make()
+
+def function():
+    pass
+"""
+    return ast.parse(code)
+
+
+class TestModuleIndex:
+    """Test suite for the per-module AST index."""
+
+    def test_index_collects_definitions(self, nested_classes_module: ast.Module):
+        """
+        Test that all classes and functions of a module are indexed.
+        """
+        index = module_index(nested_classes_module)
+
+        assert [node.name for node in index.class_defs] == ["Outer", "Inner"]
+        assert [node.name for node in index.func_defs] == ["function", "method"]
+        assert index.class_names == frozenset({"Outer", "Inner"})
+        assert [[method.name for method in methods]
+                for methods in index.methods_by_class.values()] == [["method"], []]
+
+    def test_index_attributes_calls_to_classes(self, nested_classes_module: ast.Module):
+        """
+        Test that calls are attributed to the innermost enclosing class only.
+        """
+        index = module_index(nested_classes_module)
+        outer, inner = index.class_defs
+
+        assert {call.func.id for call in index.calls_by_class[outer]} == {"helper"}
+        assert {call.func.id for call in index.calls_by_class[inner]} == {"make"}
+
+    def test_index_collects_imports_and_coroutines(self):
+        """
+        Test that imports and coroutine functions are indexed alongside plain functions.
+        """
+        module = ast.parse("""
+import os
+from pathlib import Path
+
+async def fetch():
+    def parse():
+        pass
+""")
+        index = module_index(module)
+
+        assert [type(node) for node in index.imports] == [ast.Import, ast.ImportFrom]
+        assert [node.name for node in index.all_func_defs] == ["fetch", "parse"]
+        assert [node.name for node in index.func_defs] == ["parse"]
+
+    def test_index_is_built_once(self, nested_classes_module: ast.Module):
+        """
+        Test that the index is cached on the module.
+        """
+        assert module_index(nested_classes_module) is module_index(nested_classes_module)
+
+    def test_index_groups_classes_by_name(self):
+        """
+        Test that classes sharing a name are all reachable by that name.
+        """
+        module = ast.parse("""
+class Base:
+    pass
+
+class Base:
+    pass
+
+class Child(Base):
+    pass
+    """)
+        index = module_index(module)
+
+        assert [node.name for node in index.classes_by_name["Base"]] == ["Base", "Base"]
+        assert index.classes_by_name["Base"][0] is index.class_defs[0]
+        assert index.class_names == frozenset({"Base", "Child"})
+        assert index.passes == 3
@@ -0,0 +1,73 @@
+"""
+This module provides tests of parallel helpers
+"""
+
+import ast
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from python_ext_stats import config
+from python_ext_stats import parallel
+
+
+@pytest.fixture
+def forced_parallelism(monkeypatch: pytest.MonkeyPatch):
+    """Fixture making parallel_map use processes for any input."""
+    monkeypatch.setattr(config, "PARALLEL_MIN_ITEMS", 1)
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    parallel.shutdown_worker_pool()
+    yield
+    parallel.shutdown_worker_pool()
+
+
+@pytest.mark.usefixtures("forced_parallelism")
+def test_parallel_map_keeps_order():
+    """
+    Test that results come back in the order of the items.
+    """
+    assert parallel.parallel_map(abs, [-3, 2, -1]) == [3, 2, 1]
+
+
+@pytest.mark.usefixtures("forced_parallelism")
+def test_worker_pool_is_shared():
+    """
+    Test that consecutive parallel_map calls reuse one worker pool.
+    """
+    parallel.parallel_map(abs, [-1, -2])
+    first_pool = parallel.get_worker_pool(2)
+    parallel.parallel_map(abs, [-3, -4])
+
+    assert parallel.get_worker_pool(2) is first_pool
+
+
+@pytest.mark.usefixtures("forced_parallelism")
+def test_free_threaded_build_uses_threads(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that without the GIL modules are handed to threads instead of processes.
+    """
+    monkeypatch.setattr("sys._is_gil_enabled", lambda: False, raising=False)
+    module = ast.parse("x = 1")
+
+    assert parallel.parallel_map(id, [module]) == [id(module)]
+    assert isinstance(parallel.get_worker_pool(2), ThreadPoolExecutor)
+
+
+@pytest.mark.usefixtures("forced_parallelism")
+def test_submit_runs_in_worker_pool():
+    """
+    Test that a submitted function gets the whole list in the shared pool.
+    """
+    assert parallel.submit(sorted, [3, 1, 2]).result() == [1, 2, 3]
+
+
+def test_submit_runs_small_inputs_right_away():
+    """
+    Test that small inputs are handled in this process, errors included.
+    """
+    def fail(items):
+        raise ValueError(items)
+
+    assert parallel.submit(sorted, [2, 1]).done()
+    with pytest.raises(ValueError):
+        parallel.submit(fail, [1]).result()
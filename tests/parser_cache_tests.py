@@ -0,0 +1,93 @@
+"""
+This module provides parser cache tests
+"""
+
+import os
+from pathlib import Path
+import ast
+
+import pytest
+
+from python_ext_stats import config, parallel
+from python_ext_stats.metrics.code_structure_metrics import CodeStructuresMetrics
+from python_ext_stats.parser_cache import parse_file, parse_files
+
+
+def test_unchanged_file_is_parsed_once(tmp_path: Path):
+    """
+    Test that an unchanged file gives back the same tree.
+    """
+    py_file = tmp_path / "module.py"
+    py_file.write_text("x = 1\n", encoding="utf-8")
+
+    assert parse_file(py_file) is parse_file(py_file)
+
+
+def test_changed_file_is_parsed_again(tmp_path: Path):
+    """
+    Test that a modified file is parsed again.
+    """
+    py_file = tmp_path / "module.py"
+    py_file.write_text("x = 1\n", encoding="utf-8")
+    first = parse_file(py_file)
+
+    py_file.write_text("def func():\n    pass\n", encoding="utf-8")
+    stat = py_file.stat()
+    os.utime(py_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = parse_file(py_file)
+
+    assert second is not first
+    assert isinstance(second.body[0], ast.FunctionDef)
+
+
+def test_source_is_decoded_by_its_coding_declaration(tmp_path: Path):
+    """
+    Test that a file parsed from its bytes is decoded as declared.
+    """
+    py_file = tmp_path / "module.py"
+    py_file.write_bytes("# -*- coding: latin-1 -*-\nname = 'café'\n".encode("latin-1"))
+
+    tree = parse_file(py_file)
+
+    assert tree.body[0].value.value == "café"
+
+
+@pytest.mark.parametrize("gil_enabled", [True, False])
+def test_parse_files_keeps_order_and_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+                                           gil_enabled: bool):
+    """
+    Test that files parsed together, on threads without the GIL, come back in order
+    and are shared with the cache.
+    """
+    monkeypatch.setattr("sys._is_gil_enabled", lambda: gil_enabled, raising=False)
+    monkeypatch.setattr(config, "PARALLEL_MIN_ITEMS", 1)
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    parallel.shutdown_worker_pool()
+
+    py_files = []
+    for i in range(3):
+        py_file = tmp_path / f"module_{i}.py"
+        py_file.write_text(f"x = {i}\n", encoding="utf-8")
+        py_files.append(py_file)
+
+    try:
+        trees = parse_files(py_files)
+    finally:
+        parallel.shutdown_worker_pool()
+
+    assert [tree.body[0].value.value for tree in trees] == [0, 1, 2]
+    assert all(tree is parse_file(py_file) for tree, py_file in zip(trees, py_files))
+
+
+def test_identical_files_share_a_tree(tmp_path: Path):
+    """
+    Test that files with the same content are parsed once and still counted per file.
+    """
+    py_files = [tmp_path / "first.py", tmp_path / "second.py"]
+    for py_file in py_files:
+        py_file.write_text("class Model:\n    pass\n", encoding="utf-8")
+
+    first, second = parse_files(py_files)
+
+    assert first is second
+    assert CodeStructuresMetrics.count_number_of_classes([first, second]) == 2
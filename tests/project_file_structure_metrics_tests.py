@@ -88,3 +88,24 @@ class TestProjectFileStructureMetrics:
         assert maintainability_metrics.\
             get_depth_of_the_project_file_system_tree\
                 (three_level_repo_tree, Path(tmp_path)) == 3
+
+    def test_get_depth_of_the_project_file_system_tree_relative_repo(self, three_level_repo_tree,\
+                                                                     maintainability_metrics,\
+                                                                     tmp_path, monkeypatch):
+        """
+        Tests for depth of a tree given by a relative repository path
+        """
+        monkeypatch.chdir(tmp_path)
+        files = [file.relative_to(tmp_path) for file in three_level_repo_tree]
+        assert maintainability_metrics.\
+            get_depth_of_the_project_file_system_tree\
+                (files, Path(".")) == 3
+
+    def test_get_depth_of_the_project_file_system_tree_outside_repo(self, maintainability_metrics,\
+                                                                    tmp_path):
+        """
+        Tests that a file outside of the repository is rejected
+        """
+        with pytest.raises(ValueError):
+            maintainability_metrics.get_depth_of_the_project_file_system_tree\
+                ([tmp_path / "repo" / "a.py", tmp_path / "other" / "b.py"], tmp_path / "repo")
@@ -6,6 +6,7 @@ This module provides readability and formatting metrics tests
 import ast
 import pytest
 
+from python_ext_stats.metrics import readability_and_formatting_metrics
 from python_ext_stats.metrics.readability_and_formatting_metrics\
       import ReadabilityAndFormattingMetrics
 
@@ -109,6 +110,15 @@ def my_function():
             count_lines_of_code(multi_line_files)
         assert loc == 3
 
+    def test_lines_of_code_with_other_line_endings(self, metrics, tmp_path):
+        """Test that CR endings split lines and a unicode space line is blank."""
+        file1 = tmp_path / "cr.py"
+        file1.write_bytes(b"x = 1\ry = 2\r\rz = 3\r")
+        file2 = tmp_path / "nbsp.py"
+        file2.write_bytes('s = """\n\u00a0\n"""\n'.encode("utf-8"))
+
+        assert metrics.count_lines_of_code([file1, file2]) == 3 + 2
+
     def test_average_line_length(self, metrics, mixed_length_files):
         """Test average line length calculation."""
         avg = metrics.\
@@ -136,3 +146,18 @@ def my_function():
         count = metrics.\
             count_number_pass_keywords(parsed_pass_statements)
         assert count == 2
+
+    def test_value_reads_each_file_once(self, metrics, multi_line_files, monkeypatch):
+        """Test that all line metrics of value() come from a single read of each file."""
+        read_files = []
+        read_lines = readability_and_formatting_metrics._read_lines  # pylint: disable=protected-access
+
+        def counting_read_lines(py_file_path):
+            read_files.append(py_file_path)
+            return read_lines(py_file_path)
+
+        monkeypatch.setattr(readability_and_formatting_metrics, "_read_lines", counting_read_lines)
+        result = metrics.value([], multi_line_files)
+
+        assert sorted(read_files) == sorted(multi_line_files)
+        assert result["Lines of Code"] == 3